@@ -1,9 +1,16 @@
+import copy
 from datetime import timedelta
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
 
 from physlearn.names import DataBaseName, LabelType, NonSignalDataType, SignalType
 from physlearn.typing import Array
 
+# Default of optional arguments where `None` (or any falsy value) is a legal value
+_MISSING = object()
+
 
 class Signal:
     """A signal base class.
@@ -13,7 +20,7 @@ class Signal:
     signal.
       end_time: The time from the beginning of the record until the beginning of the
     signal.
-      time_axis: A tensor with the time axis of the signal, shape: [1, time steps].
+      time_axis: A tensor with the time axis of the signal, shape: [time steps].
       signal: The signal tensor of shape [channels, time steps].
       signal_type: What kind of signal is it?
       channel_names: sequence of channel names in the signal. For example: names of
@@ -21,6 +28,18 @@ class Signal:
 
     """
 
+    __slots__ = (
+        "_start_time",
+        "_end_time",
+        "_time_axis",
+        "_signal",
+        "_signal_type",
+        "_channel_names",
+        "_num_channels",
+        "_channel_index",
+        "_storage_dtype",
+    )
+
     def __init__(
         self,
         start_time: timedelta,
@@ -29,6 +48,7 @@ class Signal:
         signal: Array,
         signal_type: SignalType,
         channel_names: Optional[Sequence[str]] = None,
+        storage_dtype: Optional[DTypeLike] = None,
     ):
         """
 
@@ -38,29 +58,134 @@ class Signal:
             end_time: The time from the beginning of the record until the beginning of
         the signal.
             time_axis: A tensor with the time axis of the signal,
-        with shape: [1, time steps].
+        with shape: [time steps] or [1, time steps].
             signal: The signal tensor of shape [channels, time steps].
             signal_type: What kind of signal is it?
             channel_names: Names of the channels in the signal. For example: names of
         different EEG electrodes.
+            storage_dtype: The dtype to store the signal in, e.g. `np.float16` (or
+        `ml_dtypes.bfloat16`) to halve the memory traffic of float32 signals. Keeps
+        the dtype of the given signal by default. Note that signals are compared in
+        their storage dtype.
         """
+        if storage_dtype is not None:
+            storage_dtype = np.dtype(storage_dtype)
+            signal = np.asarray(signal, dtype=storage_dtype)
+        self._set_fields(
+            start_time,
+            end_time,
+            time_axis,
+            signal,
+            signal_type,
+            channel_names,
+            storage_dtype,
+        )
+        self.check_dimensions()
+        self.check_times()
+        self._check_num_channels()
+
+    def _set_fields(
+        self,
+        start_time: timedelta,
+        end_time: timedelta,
+        time_axis: Array,
+        signal: Array,
+        signal_type: SignalType,
+        channel_names: Optional[Sequence[str]],
+        storage_dtype: Optional[np.dtype] = None,
+    ):
+        """Stores the fields of the signal and the values derived from them"""
         self._start_time = start_time
         self._end_time = end_time
-        self._time_axis = time_axis
+        self._time_axis = np.ascontiguousarray(time_axis).reshape(-1)
         self._signal = signal
         self._signal_type = signal_type
         self._channel_names = channel_names
         self._num_channels = self.get_num_channels()
-        self.check_dimensions()
-        self.check_times()
-        self._check_num_channels()
+        self._channel_index = self._build_channel_index()
+        self._storage_dtype = storage_dtype
+
+    @classmethod
+    def _unchecked(
+        cls,
+        start_time: timedelta,
+        end_time: timedelta,
+        time_axis: Array,
+        signal: Array,
+        signal_type: SignalType,
+        channel_names: Optional[Sequence[str]] = None,
+        storage_dtype: Optional[np.dtype] = None,
+    ):
+        """Creates a signal without validating it, for fields known to be valid"""
+        new = cls.__new__(cls)
+        new._set_fields(
+            start_time,
+            end_time,
+            time_axis,
+            signal,
+            signal_type,
+            channel_names,
+            storage_dtype,
+        )
+        return new
+
+    @classmethod
+    def bulk_construct(cls, records: Sequence[Dict[str, Any]]) -> List["Signal"]:
+        """
+        Creates multiple signals, validating all of them at once.
+
+        Performs the same checks as the constructor, but as a few array operations over
+        all the signals instead of a few function calls per signal.
+
+        Args:
+            records: Keyword arguments for the creation of each signal (without
+            `storage_dtype`).
+
+        Returns:
+            A list of signals, ordered as the given records.
+        """
+        signals = [cls._unchecked(**record) for record in records]
+        if not signals:
+            return signals
+
+        # Empty signals are legal regardless of the time axis, marked by -1
+        signal_lens = np.array(
+            [s._signal.shape[1] if s._signal.size else -1 for s in signals]
+        )
+        time_lens = np.array([s._time_axis.shape[0] for s in signals])
+        if not ((signal_lens == -1) | (signal_lens == time_lens)).all():
+            raise ValueError(
+                "Illegal signal dimensions, the signal has to be of the "
+                "same length as the time axis or empty"
+            )
+
+        if not all(s._end_time > s._start_time for s in signals):
+            raise ValueError("End time can't be before or same as start time")
+
+        # Signals without channel names are not checked, marked by -1
+        num_names = np.array(
+            [len(s._channel_names) if s._channel_names else -1 for s in signals]
+        )
+        num_channels = np.array([s._num_channels for s in signals])
+        if not ((num_names == -1) | (num_names == num_channels)).all():
+            raise ValueError("Number of channels mismatch channel names")
+
+        return signals
 
     def __getitem__(self, idx):
         """
         Syntactic sugar, allows getting data from a Signal object like:
         >>> signal[1:2, :1000]
+
+        Basic slicing returns a read-only view of the signal, advanced (fancy)
+        indexing returns a new array as NumPy always copies in that case.
         """
-        return self.signal[idx].copy()
+        item = self._signal[idx]
+        # Only basic slicing results can share memory, so the cheap bounds check is
+        # enough, unlike np.shares_memory which solves the exact overlap problem
+        if isinstance(item, np.ndarray) and np.may_share_memory(item, self._signal):
+            return _read_only(item)
+        return item
 
     @property
     def start_time(self):
@@ -74,12 +199,35 @@ class Signal:
 
     @property
     def time_axis(self):
-        """ """
-        return self._time_axis.copy()
+        """A read-only view of the time axis, shape: [time steps]"""
+        return _read_only(self._time_axis)
+
+    @property
+    def time_axis_2d(self):
+        """A read-only view of the time axis, shape: [1, time steps]"""
+        return _read_only(self._time_axis[None, :])
 
     @property
     def signal(self):
-        """ """
+        """A read-only view of the signal, use `signal_copy` for a mutable copy"""
+        return _read_only(self._signal)
+
+    def signal_as(self, dtype: DTypeLike) -> Array:
+        """
+        Args:
+            dtype: The desired dtype
+
+        Returns: A read-only view of the signal if it is stored in the given dtype,
+        otherwise a copy of the signal cast to the given dtype.
+        """
+        if self._signal.dtype == np.dtype(dtype):
+            return _read_only(self._signal)
+        return self._signal.astype(dtype)
+
+    def signal_copy(self) -> Array:
+        """
+        Returns: A writeable copy of the signal tensor.
+        """
         return self._signal.copy()
 
     @property
@@ -100,13 +248,13 @@ class Signal:
         return self._num_channels
 
     def get_num_channels(self):
-        return self.signal.shape[0]
+        return self._signal.shape[0]
 
     def check_dimensions(self):
         """Signals can either be of the same length as the time axis or empty"""
-        if not self.signal.size:
+        if not self._signal.size:
             return
-        elif self.signal.shape[1] == self.time_axis.shape[1]:
+        elif self._signal.shape[1] == self._time_axis.shape[0]:
             return
         else:
             raise ValueError(
@@ -120,12 +268,14 @@ class Signal:
             raise ValueError("End time can't be before or same as start time")
 
     def __eq__(self, other):
+        # Cheap scalar checks first so mismatches exit before touching the tensors
         return bool(
-            self.start_time == other.start_time
-            and self.end_time == other.end_time
-            and (self.time_axis == other.time_axis).all()
-            and (self.signal == other.signal).all()
-            and self.signal_type == other.signal_type
+            self._signal_type == other._signal_type
+            and self._start_time == other._start_time
+            and self._end_time == other._end_time
+            and self._signal.shape == other._signal.shape
+            and np.array_equal(self._time_axis, other._time_axis)
+            and np.array_equal(self._signal, other._signal)
         )
 
     def _check_num_channels(self):
@@ -143,44 +293,199 @@ class Signal:
         Returns the index of the given channel in the list of channel names
         of the signal.
         """
-        if desired_channel_name not in self.channel_names:
+        try:
+            return self._channel_index[desired_channel_name]
+        except KeyError:
             raise ValueError(
-                f"Channel {desired_channel_name} not found" f"in channel names"
-            )
-        else:
-            return tuple(
-                i for i, e in enumerate(self.channel_names) if e == desired_channel_name
-            )
+                f"Channel {desired_channel_name} not found in channel names"
+            ) from None
+
+    def _build_channel_index(self) -> Dict[str, Tuple[int, ...]]:
+        """
+        Maps each channel name to the indices of the channels with that name.
+        """
+        channel_index: Dict[str, List[int]] = {}
+        for i, name in enumerate(self._channel_names or ()):
+            channel_index.setdefault(name, []).append(i)
+        return {name: tuple(indices) for name, indices in channel_index.items()}
 
     def signal_like_this(
         self,
-        start_time: timedelta = None,
-        end_time: timedelta = None,
-        time_axis: Array = None,
-        signal: Array = None,
-        signal_type: SignalType = None,
+        start_time: timedelta = _MISSING,
+        end_time: timedelta = _MISSING,
+        time_axis: Array = _MISSING,
+        signal: Array = _MISSING,
+        signal_type: SignalType = _MISSING,
+        channel_names: Optional[Sequence[str]] = _MISSING,
+    ):
+        """
+        Creates a signal of the same class with some of the fields replaced. Only the
+        checks that involve replaced fields are performed. The storage dtype carries
+        over: if this signal was created with one, a replaced signal is stored in it,
+        otherwise a replaced signal keeps its own dtype.
+
+        Note:
+            Additional state of inheriting classes is copied shallowly, without calling
+        their `__init__`. Inheriting classes that need otherwise should override this
+        method.
+        """
+        if signal is not _MISSING and self._storage_dtype is not None:
+            signal = np.asarray(signal, dtype=self._storage_dtype)
+        # A shallow copy keeps the additional state of inheriting classes, the fields
+        # of the signal are then replaced without validation
+        new = copy.copy(self)
+        new._set_fields(
+            start_time=start_time if start_time is not _MISSING else self._start_time,
+            end_time=end_time if end_time is not _MISSING else self._end_time,
+            time_axis=time_axis if time_axis is not _MISSING else self._time_axis,
+            signal=signal if signal is not _MISSING else self._signal,
+            signal_type=(
+                signal_type if signal_type is not _MISSING else self._signal_type
+            ),
+            channel_names=(
+                channel_names if channel_names is not _MISSING else self._channel_names
+            ),
+            storage_dtype=self._storage_dtype,
+        )
+
+        if signal is not _MISSING or time_axis is not _MISSING:
+            new.check_dimensions()
+        if start_time is not _MISSING or end_time is not _MISSING:
+            new.check_times()
+        if signal is not _MISSING or channel_names is not _MISSING:
+            new._check_num_channels()
+
+        return new
+
+
+class SignalTable:
+    """A batch of signals of the same type stored as stacked tensors.
+
+    Instead of one tensor per signal, all the signals are stacked once into a single
+    contiguous tensor so batch operations (and conversion to torch tensors) don't need
+    to walk over the individual signals.
+
+    Args:
+      signal_type: The type of all the signals in the table.
+      data: The stacked signals, shape: [signals, channels, time steps].
+      time_axis: The stacked time axes, shape: [signals, time steps].
+      start_times: The start time of each signal.
+      end_times: The end time of each signal.
+      channel_names: The channel names shared by all the signals.
+
+    """
+
+    __slots__ = (
+        "_signal_type",
+        "_data",
+        "_time_axis",
+        "_start_times",
+        "_end_times",
+        "_channel_names",
+    )
+
+    def __init__(
+        self,
+        signal_type: SignalType,
+        data: Array,
+        time_axis: Array,
+        start_times: Sequence[timedelta],
+        end_times: Sequence[timedelta],
         channel_names: Optional[Sequence[str]] = None,
     ):
+        self._signal_type = signal_type
+        self._data = data
+        self._time_axis = time_axis
+        self._start_times = tuple(start_times)
+        self._end_times = tuple(end_times)
+        self._channel_names = channel_names
+        if not (
+            data.shape[0]
+            == time_axis.shape[0]
+            == len(self._start_times)
+            == len(self._end_times)
+        ):
+            raise ValueError("Number of signals mismatch between the table fields")
+
+    @classmethod
+    def from_signals(cls, signals: Sequence[Signal]) -> "SignalTable":
+        """
+        Stacks signals of the same type, shape and channel names into a table.
 
-        if not type(self) == Signal:
-            raise NotImplementedError("Inheriting classes should override this method")
-
-        start_time = start_time if start_time else self.start_time
-        end_time = end_time if end_time else self.end_time
-        time_axis = time_axis if time_axis is not None else self.time_axis
-        signal = signal if signal is not None else self.signal
-        signal_type = signal_type if signal_type else self.signal_type
-        channel_names = channel_names if channel_names else self.channel_names
-
-        return Signal(
-            start_time=start_time,
-            end_time=end_time,
-            time_axis=time_axis,
-            signal=signal,
-            signal_type=signal_type,
-            channel_names=channel_names,
+        Args:
+            signals: The signals to stack
+
+        Returns:
+            A table containing all the given signals in the given order.
+        """
+        if not signals:
+            raise ValueError("Can't create a signal table without signals")
+        first = signals[0]
+        for signal in signals:
+            if signal._signal_type != first._signal_type:
+                raise ValueError("All the signals in a table must be of the same type")
+            if signal._channel_names != first._channel_names:
+                raise ValueError(
+                    "All the signals in a table must have the same channels"
+                )
+
+        return cls(
+            signal_type=first._signal_type,
+            data=np.stack([signal._signal for signal in signals]),
+            time_axis=np.stack([signal._time_axis for signal in signals]),
+            start_times=[signal._start_time for signal in signals],
+            end_times=[signal._end_time for signal in signals],
+            channel_names=first._channel_names,
         )
 
+    def iter_signals(self) -> Iterator[Signal]:
+        """
+        Yields: The signals in the table, sharing memory with the table.
+        """
+        for i in range(len(self)):
+            yield Signal._unchecked(
+                start_time=self._start_times[i],
+                end_time=self._end_times[i],
+                time_axis=self._time_axis[i],
+                signal=self._data[i],
+                signal_type=self._signal_type,
+                channel_names=self._channel_names,
+            )
+
+    def __len__(self):
+        """Number of signals in the table"""
+        return self._data.shape[0]
+
+    @property
+    def signal_type(self):
+        """ """
+        return self._signal_type
+
+    @property
+    def data(self):
+        """A read-only view of the stacked signals"""
+        return _read_only(self._data)
+
+    @property
+    def time_axis(self):
+        """A read-only view of the stacked time axes"""
+        return _read_only(self._time_axis)
+
+    @property
+    def start_times(self):
+        """ """
+        return self._start_times
+
+    @property
+    def end_times(self):
+        """ """
+        return self._end_times
+
+    @property
+    def channel_names(self):
+        """ """
+        return self._channel_names
+
 
 class Sample:
     """
@@ -188,6 +493,18 @@ class Sample:
     May include a full or a partial recording.
     """
 
+    __slots__ = (
+        "_db",
+        "_db_version",
+        "_patient_id",
+        "_record_id",
+        "_sample_id",
+        "_signals",
+        "_data",
+        "_metadata",
+        "_label",
+    )
+
     def __init__(
         self,
         db: DataBaseName,
@@ -239,31 +556,35 @@ class Sample:
 
     def sample_like_this(
         self,
-        db: Optional[DataBaseName] = None,
-        db_version: Optional[str] = None,
-        patient_id: Optional[int] = None,
-        sample_id: Optional[int] = None,
-        signals: Optional[Dict[SignalType, Signal]] = None,
-        data: Optional[Dict[NonSignalDataType, Array]] = None,
-        metadata: Optional[Dict[NonSignalDataType, Any]] = None,
-        label: Optional[Dict[LabelType, Array]] = None,
-        record_id: Optional[int] = None,
+        db: DataBaseName = _MISSING,
+        db_version: str = _MISSING,
+        patient_id: int = _MISSING,
+        sample_id: int = _MISSING,
+        signals: Dict[SignalType, Signal] = _MISSING,
+        data: Dict[NonSignalDataType, Array] = _MISSING,
+        metadata: Dict[NonSignalDataType, Any] = _MISSING,
+        label: Dict[LabelType, Array] = _MISSING,
+        record_id: int = _MISSING,
         **kwargs,
     ):
-        if not type(self) == Sample:
-            raise NotImplementedError("Inheriting classes should override this method")
-
-        db = db if db else self.db
-        db_version = db_version if db_version else self.db_version
-        patient_id = patient_id if patient_id else self.patient_id
-        sample_id = sample_id if sample_id else self.sample_id
-        signals = signals if signals else self.signals
-        data = data if data else self.data
-        metadata = metadata if metadata else self.metadata
-        label = label if label else self.label
-        record_id = record_id if record_id else self.record_id
-
-        return Sample(
+        """
+        Creates a sample of the same class with some of the fields replaced.
+
+        Note:
+            Inheriting classes with a different constructor should override this
+            method.
+        """
+        db = db if db is not _MISSING else self._db
+        db_version = db_version if db_version is not _MISSING else self._db_version
+        patient_id = patient_id if patient_id is not _MISSING else self._patient_id
+        sample_id = sample_id if sample_id is not _MISSING else self._sample_id
+        signals = signals if signals is not _MISSING else self._signals
+        data = data if data is not _MISSING else self._data
+        metadata = metadata if metadata is not _MISSING else self._metadata
+        label = label if label is not _MISSING else self._label
+        record_id = record_id if record_id is not _MISSING else self._record_id
+
+        return type(self)(
             db=db,
             db_version=db_version,
             patient_id=patient_id,
@@ -316,20 +637,45 @@ class Sample:
         return self._label
 
     def __eq__(self, other):
-        return all(
-            [
-                self.db == other.db,
-                self.db_version == other.db_version,
-                self.patient_id == other.patient_id,
-                self.record_id == other.record_id,
-                self.sample_id == other.sample_id,
-                self.signals == other.signals,
-                compare_tensor_dict(self.data, other.data),
-                compare_tensor_dict(self.label, other.label),
-            ]
+        return (
+            self._db == other._db
+            and self._db_version == other._db_version
+            and self._patient_id == other._patient_id
+            and self._record_id == other._record_id
+            and self._sample_id == other._sample_id
+            # The keys are compared (as they are now, the dicts are mutable) before
+            # any signal or tensor comparison
+            and (self._data or {}).keys() == (other._data or {}).keys()
+            and (self._label or {}).keys() == (other._label or {}).keys()
+            and self._signals == other._signals
+            and compare_tensor_dict(self._data or {}, other._data or {})
+            and compare_tensor_dict(self._label or {}, other._label or {})
         )
 
 
+def _read_only(array: Array) -> Array:
+    """Returns a view of an array that can't be used to modify the array's data.
+
+    Args:
+      array: The array to view
+
+    Returns:
+        A read-only view sharing memory with the given array.
+
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _array_equal(a: Array, b: Array) -> bool:
+    if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    # np.array_equal returns False for tensors it can't convert (e.g. tensors that
+    # require grad or aren't on the CPU), so tensors are compared elementwise
+    return a.shape == b.shape and bool((a == b).all())
+
+
 def compare_tensor_dict(d1: Dict[Any, Array], d2: Dict[Any, Array]):
     """Compare two dictionaries of tensors
 
@@ -343,7 +689,7 @@ def compare_tensor_dict(d1: Dict[Any, Array], d2: Dict[Any, Array]):
     if not d1 and not d2:
         return True
 
-    return (
-        all([(t1 == t2).all() for t1, t2 in zip(d1.values(), d2.values())])
-        and d1.keys() == d2.keys()
-    )
+    if d1.keys() != d2.keys():
+        return False
+
+    return all(_array_equal(d1[k], d2[k]) for k in d1)
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Any, Dict, Iterable, Sequence, Tuple, Union
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
+import torch
 from torch import Tensor
 from torch.utils.data import Dataset as TorchDataset
 
@@ -14,6 +17,7 @@ from physlearn.names import (
     NonSignalDataType,
     SignalType,
 )
+from physlearn.typing import Array
 
 
 class DataSource(ABC):
@@ -53,6 +57,9 @@ class DataSource(ABC):
         specific context.
     """
 
+    _sample_index_cache: Optional[Array] = None
+    _patient_id_cache: Optional[Array] = None
+
     @abstractmethod
     def __getitem__(self, idx: Sequence[int]) -> Sample:
         """
@@ -65,6 +72,28 @@ class DataSource(ABC):
         """
         pass
 
+    def get_samples(
+        self, indices: Union[Array, Sequence[Sequence[int]]]
+    ) -> List[Sample]:
+        """
+        Returns multiple samples from the data source.
+
+        The default implementation simply calls `__getitem__` for every index.
+        Sources backed by files (HDF5, NPZ, etc.) should override it to read
+        contiguous ranges with a single I/O operation and construct the tensors of all
+        the samples at once.
+
+        Args:
+            indices: Indices of the samples, an array of shape `[number of samples, 3]`
+            or a sequence of indices of the shape `(patient ID, record ID, sample ID)`.
+
+        Returns:
+            A list of samples, ordered as the given indices.
+        """
+        if isinstance(indices, np.ndarray):
+            indices = indices.tolist()
+        return [self[tuple(idx)] for idx in indices]
+
     @abstractmethod
     def record_ids_per_patient(self, patient_id: int) -> Sequence[int]:
         """
@@ -115,6 +144,10 @@ class DataSource(ABC):
             metadata: containing information such about the record such as seizure
         data, age, gender, atc.
 
+        Note:
+            `Signal` stores the given arrays without copying them, so implementations
+        reading from files should prefer returning read-only memory mapped views (see
+        `physlearn.utils.mmap_signal`) over reading the data into new arrays.
         """
         pass
 
@@ -153,11 +186,10 @@ class DataSource(ABC):
         """Properties of the current source, e.g. processing done, limitations."""
         pass
 
-    @property
-    @abstractmethod
+    @cached_property
     def signature(self) -> str:
-        """The signature of the data source."""
-        pass
+        """The signature of the data source, calculated once by `_sign`."""
+        return self._sign()
 
     @property
     @abstractmethod
@@ -186,8 +218,8 @@ class DataSource(ABC):
         Returns: An hexadecimal digest of the hash.
 
         Notes:
-            As signing of large databases may be long, the DataSource class should
-            either do it lazily or to cache the signature.
+            As signing of large databases may be long, `signature` calls it lazily
+            and caches the result.
         """
         pass
 
@@ -212,13 +244,50 @@ class DataSource(ABC):
         Yields: Legal indices
 
         """
-        # for each patient
-        for patient_id in self.patient_ids:
-            # for each record
-            for record_id in self.record_ids_per_patient(patient_id):
-                # iterate over all the samples and yield their ids
-                for sample_id in self.sample_ids_per_record(patient_id, record_id):
-                    yield patient_id, record_id, sample_id
+        yield from map(tuple, self.sample_index_array.tolist())
+
+    @property
+    def sample_index_array(self) -> Array:
+        """All the legal sample ids in this DataSource as a single array
+
+        The array is built on first access and cached, hence the source hierarchy is
+        assumed not to change during the lifetime of the source.
+
+        Returns: An int64 array of shape `[number of samples, 3]`, each row is a legal
+        index of the shape `(patient ID, record ID, sample ID)`.
+        """
+        if self._sample_index_cache is None:
+            self._sample_index_cache = np.array(
+                [
+                    (patient_id, record_id, sample_id)
+                    for patient_id in self.patient_ids
+                    for record_id in self.record_ids_per_patient(patient_id)
+                    for sample_id in self.sample_ids_per_record(patient_id, record_id)
+                ],
+                dtype=np.int64,
+            ).reshape(-1, 3)
+        return self._sample_index_cache
+
+    @property
+    def patient_id_array(self) -> Array:
+        """The patient IDs of the DataSource as an int64 array, cached on first use"""
+        if self._patient_id_cache is None:
+            self._patient_id_cache = np.asarray(self.patient_ids, dtype=np.int64)
+        return self._patient_id_cache
+
+    def global_to_local(self, idx: int) -> Tuple[int, int, int]:
+        """
+        Converts a global sample index to a source index.
+
+        Args:
+            idx: Index of a sample in the sequence of all the samples in the source, as
+            ordered by `sample_ids`.
+
+        Returns:
+            The index of the sample with the shape `(patient ID, record ID, sample ID)`.
+        """
+        patient_id, record_id, sample_id = self.sample_index_array[idx].tolist()
+        return patient_id, record_id, sample_id
 
 
 class DataSink(ABC):
@@ -245,6 +314,100 @@ class DataSink(ABC):
         pass
 
 
+PackedSample = Tuple[Tuple[Tensor, ...], Tuple[Tensor, ...]]
+
+
+class DataSchema:
+    """A fixed order of the data types and label types of samples.
+
+    Allows datasets to represent samples as tuples of tensors in a fixed order instead
+    of dictionaries, so batches are collated by position, stacking each field once,
+    without per-sample dictionary walks.
+
+    Usage:
+    >>> schema = DataSchema.from_sources(sources)
+    >>> DataLoader(dataset, collate_fn=schema.collate)
+    """
+
+    def __init__(
+        self, data_types: Sequence[DataType], label_types: Sequence[LabelType]
+    ):
+        """
+        Args:
+            data_types: The data types of the samples, in a fixed order
+            label_types: The label types of the samples, in a fixed order
+        """
+        self._data_types = tuple(data_types)
+        self._label_types = tuple(label_types)
+
+    @classmethod
+    def from_sources(cls, sources: Sequence[DataSource]) -> "DataSchema":
+        """
+        Creates the schema of samples coming from the given data sources.
+
+        Args:
+            sources: The data sources of a dataset
+
+        Returns:
+            A schema with the signal types and feature types of all the sources as the
+            data types and all their label types as the label types.
+        """
+        data_types: Dict[DataType, None] = {}
+        label_types: Dict[LabelType, None] = {}
+        for source in sources:
+            data_types.update(dict.fromkeys(source.signal_types))
+            data_types.update(dict.fromkeys(source.feature_types))
+            label_types.update(dict.fromkeys(source.labels))
+        return cls(tuple(data_types), tuple(label_types))
+
+    def pack(
+        self, x: Dict[DataType, Tensor], y: Dict[LabelType, Tensor]
+    ) -> PackedSample:
+        """
+        Converts a sample from dictionaries to tuples ordered by the schema.
+
+        Args:
+            x: The sample data
+            y: The sample labels
+
+        Returns:
+            A tuple of the data tensors and a tuple of the label tensors.
+        """
+        return (
+            tuple(x[t] for t in self._data_types),
+            tuple(y[t] for t in self._label_types),
+        )
+
+    def collate(
+        self, batch: Sequence[PackedSample]
+    ) -> Tuple[Dict[DataType, Tensor], Dict[LabelType, Tensor]]:
+        """
+        Collates packed samples into a batch, can be used as a DataLoader collate_fn.
+
+        Args:
+            batch: Packed samples
+
+        Returns:
+            The batch in the structure expected by trainers and models, a dictionary of
+            the stacked data tensors and a dictionary of the stacked label tensors.
+        """
+        xs, ys = zip(*batch)
+        return (
+            dict(zip(self._data_types, map(torch.stack, zip(*xs)))),
+            dict(zip(self._label_types, map(torch.stack, zip(*ys)))),
+        )
+
+    @property
+    def data_types(self) -> Tuple[DataType, ...]:
+        """ """
+        return self._data_types
+
+    @property
+    def label_types(self) -> Tuple[LabelType, ...]:
+        """ """
+        return self._label_types
+
+
 class Dataset(TorchDataset):
     """A base class for all datasets. Allows access to several data sources as a unified
     dataset. Implements pytorch Dataset API to allow DataLoader to load and batch
@@ -254,6 +417,13 @@ class Dataset(TorchDataset):
     varying length input and runtime processing and provide downstream components
     uniformly structured samples suitable for being an input for a torch model.
 
+    Note:
+        When loading several samples of the same source (e.g. a range of indices),
+        prefer `DataSource.get_samples` over multiple calls to `DataSource.__getitem__`
+        to let the source batch the reads.
+        Datasets with a fixed set of data and label types may return
+        `DataSchema.pack` outputs and use `DataSchema.collate` as the collate function
+        of the DataLoader, avoiding per-sample dictionaries in the batching.
     """
 
     @abstractmethod
@@ -25,8 +25,9 @@ class Labeler(ABC):
             A sample with additional labels based on the provided metadata
 
         """
-        new_label = self.create_label(x, metadata)
-        return x.sample_like_this(label={**x.label, **new_label})
+        label = x.label.copy()
+        label.update(self.create_label(x, metadata))
+        return x.sample_like_this(label=label)
 
     @abstractmethod
     def create_label(
@@ -7,6 +7,8 @@ from physlearn.names import LabelType, LossType
 
 
 class LossResult(ABC):
+    __slots__ = ("_value",)
+
     def __init__(self, value: float):
         self._value = value
 
@@ -12,12 +12,37 @@ class Processor(ABC):
     normalization, data augmentation, etc.
     """
 
+    # Whether the processing steps are overridden, the base class steps are identities
+    # so __call__ skips them when they are not.
+    _processes_signals = False
+    _processes_data = False
+    _processes_label = False
+    _extracts_features = False
+    # Whether the processor doesn't override any processing step, so samples are
+    # returned as is
+    _is_identity = True
+
     def __init__(self):
-        if type(self, Processor):
+        if type(self) is Processor:
             raise TypeError(
                 "Processor API shouldn't be instantiated directly. Use subclasses."
             )
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._processes_signals = cls._process_signals is not Processor._process_signals
+        cls._processes_data = cls._process_data is not Processor._process_data
+        cls._processes_label = cls._process_label is not Processor._process_label
+        cls._extracts_features = (
+            cls._extract_features is not Processor._extract_features
+        )
+        cls._is_identity = cls._fused_process is Processor._fused_process and not (
+            cls._processes_signals
+            or cls._processes_data
+            or cls._processes_label
+            or cls._extracts_features
+        )
+
     def __call__(self, x: Sample, **kwargs) -> Sample:
         """Process a sample
 
@@ -31,19 +56,44 @@ class Processor(ABC):
             A processed sample
 
         """
+        if self._is_identity:
+            return x
+        return self._fused_process(x, **kwargs)
 
-        signals = self._process_signals(x.signals, data=x.data, label=x.label)
-        data = self._process_data(x.data, signals=x.signals, label=x.label)
-        features = self._extract_features(x.signals, data=x.data, label=x.label)
-        label = self._process_label(
-            x.label,
-            signals=x.signals,
-            data=x.data,
-        )
+    def _fused_process(self, x: Sample, **kwargs) -> Sample:
+        """Processes a sample in a single pass
 
-        return x.sample_like_this(
-            signals=signals, data={**data, **features}, label=label
-        )
+        The default implementation applies the separate processing steps
+        (`_process_signals`, `_process_data`, `_extract_features` and
+        `_process_label`), skipping the ones that are not overridden. Processors whose
+        steps operate on the same signals may override it to traverse each signal once,
+        e.g. filter a signal and extract its features from the filtered array in the
+        same loop, instead of reading the signals once per step.
+
+        Args:
+            x: The input sample to process
+            **kwargs: For concrete implementations
+
+        Returns:
+            A processed sample
+        """
+        # Read the sample fields once, all the steps get the original fields
+        x_signals, x_data, x_label = x.signals, x.data, x.label
+        signals, data, label = x_signals, x_data, x_label
+
+        if self._processes_signals:
+            signals = self._process_signals(x_signals, data=x_data, label=x_label)
+        if self._processes_data:
+            data = self._process_data(x_data, signals=x_signals, label=x_label)
+        if self._extracts_features:
+            features = self._extract_features(x_signals, data=x_data, label=x_label)
+            if features:
+                data = data.copy()
+                data.update(features)
+        if self._processes_label:
+            label = self._process_label(x_label, signals=x_signals, data=x_data)
+
+        return x.sample_like_this(signals=signals, data=data, label=label)
 
     def _process_signals(
         self, signals: Dict[SignalType, Signal], **kwargs
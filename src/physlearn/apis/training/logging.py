@@ -1,13 +1,20 @@
-from collections import deque
-from typing import Deque, Dict, List, Optional, Sequence, cast
+from typing import Dict, Optional, Sequence
 
 from torch import Tensor
 
 from physlearn.apis.loss import LossResult
 from physlearn.apis.models import Model
 from physlearn.apis.training.metrics import BatchMetric, EpochMetric
-from physlearn.apis.training.results import BatchResult, EpochResult, FitResult
-from physlearn.names import BatchMetricType, EpochMetricType, LabelType
+from physlearn.apis.training.results import (
+    BatchResult,
+    BatchResultBuffer,
+    EpochResult,
+    FitResult,
+)
+from physlearn.names import EpochMetricType, LabelType
+
+# Initial number of batches the batch result buffers are allocated for, when unknown
+_DEFAULT_NUM_BATCHES = 64
 
 
 class Logger:
@@ -30,11 +37,22 @@ class Logger:
         self._epoch_metrics = epoch_metrics
         self._current_epoch = start_epoch
         self._keep_output = keep_output
+        # The metric types are constant, read them once instead of in every batch
+        self._batch_metric_types = [m.type for m in batch_metrics]
+        self._epoch_metric_types = [m.type for m in epoch_metrics]
+        # The batch metrics are the same in every batch, so the epoch metrics
+        # requirements are validated once for the whole training
+        for epoch_metric in epoch_metrics:
+            epoch_metric.check_batch_metrics(self._batch_metric_types)
+        # Batch labels and predictions are only retained when needed
+        self._keep_batch_output = keep_output or any(
+            m.requires_output for m in epoch_metrics
+        )
 
-        self._current_epoch_batch_results: Deque[BatchResult] = deque()
+        self._current_epoch_batch_results = self._new_batch_buffer(_DEFAULT_NUM_BATCHES)
 
-        self._batch_train_results: Dict[int, Deque] = {}
-        self._batch_validation_results: Dict[int, Deque] = {}
+        self._batch_train_results: Dict[int, BatchResultBuffer] = {}
+        self._batch_validation_results: Dict[int, BatchResultBuffer] = {}
 
         self._epoch_train_results: Dict[int, EpochResult] = {}
         self._epoch_validation_results: Dict[int, EpochResult] = {}
@@ -66,25 +84,50 @@ class Logger:
 
         Returns: A BatchResult containing the batch loss and all metrics
         """
+        metric_values = BatchMetric.batch_values(self._batch_metrics, y, y_pred)
+
+        # Retained outputs are detached from the graph and moved to the CPU, so they
+        # don't hold on to device memory (nor to the graph) for the rest of the epoch.
+        # The metrics above already synchronized the device, so the copy doesn't stall
+        if self._keep_batch_output:
+            y, y_pred = _detach_to_cpu(y), _detach_to_cpu(y_pred)
         if self._keep_output:
             self._save_output(y, y_pred)
 
         batch_result = BatchResult(
             loss,
-            {m.type: m(y, y_pred) for m in self._batch_metrics},
+            dict(zip(self._batch_metric_types, metric_values)),
             batch_size,
-            y,
-            y_pred,
+            y if self._keep_batch_output else None,
+            y_pred if self._keep_batch_output else None,
         )
-        self._current_epoch_batch_results.append(batch_result)
+        self._current_epoch_batch_results.append(batch_result, metric_values)
         self._log_batch(logs, batch_result)
 
         return batch_result
 
-    def start_epoch(self, train: bool, validation: bool, current_epoch: int):
+    def start_epoch(
+        self,
+        train: bool,
+        validation: bool,
+        current_epoch: int,
+        num_batches: Optional[int] = None,
+    ):
+        """
+        Reports the start of an epoch.
+
+        Args:
+            train: Is it a training epoch?
+            validation: Is it a validation epoch?
+            current_epoch: The number of the epoch
+            num_batches: Expected number of batches in the epoch (e.g. the length of
+            the data loader), used to allocate the batch result buffers once.
+        """
         if train == validation:
             raise ValueError("Epoch can be either train or validation. Not both.")
-        self._current_epoch_batch_results = deque()
+        self._current_epoch_batch_results = self._new_batch_buffer(
+            num_batches or _DEFAULT_NUM_BATCHES
+        )
         self.mode = "training" if train else "validation"
         self._current_epoch = current_epoch
 
@@ -100,25 +143,22 @@ class Logger:
         the epoch and aggregated epoch metrics.
         """
 
-        batch_losses = []
-        batch_metrics: Dict[BatchMetricType, List[float]] = {
-            metric.type: [] for metric in self._batch_metrics
-        }
-        epoch_size: int = 0
-
-        for batch in self._current_epoch_batch_results:
-            batch_losses.append(batch.loss)
-            for metric in self._batch_metrics:
-                batch_metrics[metric.type].append(batch[metric.type])
-            epoch_size += batch.batch_size
+        batch_results = self._current_epoch_batch_results
+        batch_losses = batch_results.losses
+        batch_sizes = batch_results.sizes
+        epoch_size = int(batch_sizes.sum())
+        batch_metrics = batch_results.metrics
 
         epoch_metrics: Dict[EpochMetricType, float] = {}
-        for m in self._epoch_metrics:
-            epoch_metrics[m.type] = m(self._current_epoch_batch_results)
+        for t, m in zip(self._epoch_metric_types, self._epoch_metrics):
+            if m.vectorized:
+                epoch_metrics[t] = m.from_arrays(batch_metrics, batch_sizes)
+            else:
+                epoch_metrics[t] = m(batch_results)
 
         epoch_result = EpochResult(
             batch_losses,
-            cast(Dict[BatchMetricType, Sequence[float]], batch_metrics),
+            batch_metrics,
             epoch_metrics,
             epoch_size,
         )
@@ -152,57 +192,30 @@ class Logger:
 
         """
 
-        batch_train_losses: Dict[int, Sequence[LossResult]] = {}
-        batch_validation_losses: Dict[int, Sequence[LossResult]] = {}
-        batch_train_metrics: Dict[BatchMetricType, Dict[int, Sequence[float]]] = {
-            m.type: {} for m in self._batch_metrics
-        }
-        batch_validation_metrics: Dict[BatchMetricType, Dict[int, Sequence[float]]] = {
-            m.type: {} for m in self._batch_metrics
-        }
-        epoch_train_metrics: Dict[EpochMetricType, Dict[int, float]] = {
-            m.type: {} for m in self._epoch_metrics
-        }
-        epoch_validation_metrics: Dict[EpochMetricType, Dict[int, float]] = {
-            m.type: {} for m in self._epoch_metrics
-        }
-
-        for epoch, res in self._epoch_train_results.items():
-            batch_train_losses[epoch] = res.batch_losses
-            for batch_metric in self._batch_metrics:
-                batch_train_metrics[batch_metric.type][epoch] = res.batch_metrics[
-                    batch_metric.type
-                ]
-            for epoch_metric in self._epoch_metrics:
-                epoch_train_metrics[epoch_metric.type][epoch] = res.epoch_metrics[
-                    epoch_metric.type
-                ]
-
-        for epoch, res in self._epoch_validation_results.items():
-            batch_validation_losses[epoch] = res.batch_losses
-            for batch_metric in self._batch_metrics:
-                batch_validation_metrics[batch_metric.type][epoch] = res.batch_metrics[
-                    batch_metric.type
-                ]
-            for epoch_metric in self._epoch_metrics:
-                epoch_validation_metrics[epoch_metric.type][epoch] = res.epoch_metrics[
-                    epoch_metric.type
-                ]
-
         num_epochs = self._current_epoch
-        self.fit_result = FitResult(
-            batch_train_losses,
-            batch_validation_losses,
-            batch_train_metrics,
-            batch_validation_metrics,
-            epoch_train_metrics,
-            epoch_validation_metrics,
+        # Snapshots of the epoch results, so the fit result doesn't change if the
+        # logger keeps running
+        self.fit_result = FitResult.from_epoch_results(
+            dict(self._epoch_train_results),
+            dict(self._epoch_validation_results),
+            self._batch_metric_types,
+            self._epoch_metric_types,
             num_epochs,
             model,
         )
         self._log_fit(logs, fit_result=self.fit_result)
         return self.fit_result
 
+    def _new_batch_buffer(self, num_batches: int) -> BatchResultBuffer:
+        """
+        Allocates a buffer for the batch results of an epoch.
+        """
+        return BatchResultBuffer(
+            self._batch_metric_types,
+            num_batches,
+            keep_output=self._keep_batch_output,
+        )
+
     def _log_batch(self, logs: Optional[Dict], batch_result: BatchResult):
         """
         Logs the runtime and results of a single batch training. As full logging is
@@ -244,7 +257,8 @@ class Logger:
 
     def _save_output(self, y: Dict[LabelType, Tensor], y_pred: Dict[LabelType, Tensor]):
         """
-        Saves the output model predictions and their corresponding labels
+        Saves the output model predictions and their corresponding labels, both already
+        detached and on the CPU
 
         ** Not supported in the base class, inherit and implement if needed. **
 
@@ -261,3 +275,8 @@ class Logger:
         Returns: The number of the current epoch
         """
         return self._current_epoch
+
+
+def _detach_to_cpu(tensors: Dict[LabelType, Tensor]) -> Dict[LabelType, Tensor]:
+    """Detaches a dict of tensors from the graph and moves them to the CPU"""
+    return {k: v.detach().cpu() for k, v in tensors.items()}
@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Sequence
+from typing import Dict, Iterable, List, Sequence, Union
 
+import numpy as np
 import torch
 from torch import Tensor
 
 from physlearn.apis.training.results import BatchResult
 from physlearn.names import BatchMetricType, EpochMetricType, LabelType
 
+# Metrics never require gradients, inference mode also skips the view and version
+# tracking of no_grad, fall back to no_grad on torch versions without it (< 1.9)
+_no_grad = getattr(torch, "inference_mode", torch.no_grad)
+
 
 class BatchMetric(ABC):
     """
@@ -16,8 +21,79 @@ class BatchMetric(ABC):
     def __call__(
         self, y: Dict[LabelType, Tensor], y_pred: Dict[LabelType, Tensor]
     ) -> float:
-        with torch.no_grad():
-            return self._calculate_metric(y, y_pred)
+        with _no_grad():
+            return float(self._calculate_metric_tensor(y, y_pred))
+
+    @staticmethod
+    def batch_eval(
+        metrics: Sequence["BatchMetric"],
+        y: Dict[LabelType, Tensor],
+        y_pred: Dict[LabelType, Tensor],
+    ) -> Dict[BatchMetricType, float]:
+        """
+        A thin wrapper over `batch_values` that keys the values by metric type.
+
+        Args:
+            metrics: The metrics to calculate
+            y: Batch labels
+            y_pred: Batch model predictions
+
+        Returns: The metrics as simple floats, keyed by metric type
+        """
+        values = BatchMetric.batch_values(metrics, y, y_pred)
+        return {m.type: v for m, v in zip(metrics, values)}
+
+    @staticmethod
+    def batch_values(
+        metrics: Sequence["BatchMetric"],
+        y: Dict[LabelType, Tensor],
+        y_pred: Dict[LabelType, Tensor],
+    ) -> List[float]:
+        """
+        Calculates multiple metrics over a single batch, metrics calculated as tensors
+        are transferred to the CPU together with a single synchronization. Gradient
+        tracking is disabled once for all the metrics.
+
+        Args:
+            metrics: The metrics to calculate
+            y: Batch labels
+            y_pred: Batch model predictions
+
+        Returns: The metrics as simple floats, in the order of the metrics
+        """
+        with _no_grad():
+            values = [m._calculate_metric_tensor(y, y_pred) for m in metrics]
+
+        tensor_idx = [i for i, v in enumerate(values) if isinstance(v, Tensor)]
+        if tensor_idx:
+            synced = (
+                torch.stack([values[i].reshape(()).double() for i in tensor_idx])
+                .cpu()
+                .tolist()
+            )
+            for i, v in zip(tensor_idx, synced):
+                values[i] = v
+
+        return [float(v) for v in values]
+
+    def _calculate_metric_tensor(
+        self, y: Dict[LabelType, Tensor], y_pred: Dict[LabelType, Tensor]
+    ) -> Union[Tensor, float]:
+        """
+        Calculates the metric without forcing a device synchronization.
+
+        Concrete classes computing the metric with torch may override it to return a
+        0-dim tensor, so that `batch_values` synchronizes once for all the metrics.
+        Defaults to `_calculate_metric`.
+
+        Args:
+            y: Batch labels
+            y_pred: Batch model predictions
+
+        Returns: The metric as a 0-dim tensor or a simple float
+
+        """
+        return self._calculate_metric(y, y_pred)
 
     @abstractmethod
     def _calculate_metric(
@@ -49,15 +125,42 @@ class EpochMetric:
     A base class for metrics aggregated from all batch results over a single epoch
     """
 
+    # Whether the metric uses the batch labels and predictions (`BatchResult.y` and
+    # `BatchResult.y_pred`), which are otherwise not retained by the logger
+    requires_output: bool = False
+    # Whether the metric implements `_calculate_metric_vectorized`
+    vectorized: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.vectorized = (
+            cls._calculate_metric_vectorized
+            is not EpochMetric._calculate_metric_vectorized
+        )
+
     def __call__(self, batch_results: Sequence[BatchResult]) -> float:
-        for metric_type in self.required_batch_metrics:
-            for batch in batch_results:
-                if metric_type not in batch.metrics.keys():
-                    raise IndexError(
-                        f"Metric {metric_type.value} is missing in a batch"
-                    )
+        # All the batches of an epoch are evaluated with the same batch metrics, so
+        # it's enough to validate the first one
+        if len(batch_results) > 0:
+            self.check_batch_metrics(batch_results[0].metrics.keys())
         return self._calculate_metric(batch_results)
 
+    def check_batch_metrics(self, available: Iterable[BatchMetricType]):
+        """
+        Validates that all the batch metrics required for this epoch metric are
+        available.
+
+        Args:
+            available: The types of the available batch metrics
+
+        Raises:
+            IndexError: If a required batch metric is missing
+        """
+        missing = set(self.required_batch_metrics).difference(available)
+        if missing:
+            metric_type = next(iter(missing))
+            raise IndexError(f"Metric {metric_type.value} is missing in a batch")
+
     @abstractmethod
     def _calculate_metric(self, batch_results: Sequence[BatchResult]) -> float:
         """
@@ -70,6 +173,40 @@ class EpochMetric:
         """
         pass
 
+    def from_arrays(
+        self, batch_metrics: Dict[BatchMetricType, np.ndarray], batch_sizes: np.ndarray
+    ) -> float:
+        """
+        Aggregates the metric from arrays of the batch metrics, available for
+        vectorized metrics only.
+
+        Args:
+            batch_metrics: The values of each batch metric in all the batches of the
+            epoch, keyed by metric type.
+            batch_sizes: The number of samples in each batch of the epoch
+
+        Returns: The aggregated metric as a simple float
+        """
+        self.check_batch_metrics(batch_metrics.keys())
+        return self._calculate_metric_vectorized(batch_metrics, batch_sizes)
+
+    def _calculate_metric_vectorized(
+        self, batch_metrics: Dict[BatchMetricType, np.ndarray], batch_sizes: np.ndarray
+    ) -> float:
+        """
+        Optionally implements the metric calculation in concrete classes as NumPy
+        reductions over all the batches at once. When implemented, the logger prefers
+        it over `_calculate_metric`.
+
+        Args:
+            batch_metrics: The values of each batch metric in all the batches of the
+            epoch, keyed by metric type.
+            batch_sizes: The number of samples in each batch of the epoch
+
+        Returns: The aggregated metric as a simple float
+        """
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def type(self) -> EpochMetricType:
@@ -1,10 +1,14 @@
-from typing import Dict, Sequence, Union
+from collections.abc import Mapping as MappingABC
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from torch import Tensor
 
 from physlearn.apis.loss import LossResult
 from physlearn.apis.models import Model
 from physlearn.names import BatchMetricType, EpochMetricType, LabelType, LossType
+from physlearn.typing import Array
 
 
 class BatchResult:
@@ -12,33 +16,40 @@ class BatchResult:
     A container for the results of a single batch training
     """
 
+    __slots__ = ("_metrics", "_loss", "_batch_size", "_lookup", "y", "y_pred")
+
     def __init__(
         self,
         loss: LossResult,
         metrics: Dict[BatchMetricType, float],
         batch_size: int,
-        y: Dict[LabelType, Tensor],
-        y_pred: Dict[LabelType, Tensor],
+        y: Optional[Dict[LabelType, Tensor]] = None,
+        y_pred: Optional[Dict[LabelType, Tensor]] = None,
     ):
         """
         Args:
             loss: Batch loss
             metrics: Batch metrics
             batch_size: Number of samples in the batch
-            y: Batch labels
-            y_pred: Batch model predictions
+            y: Batch labels, if retained
+            y_pred: Batch model predictions, if retained
         """
         self._metrics = metrics
         self._loss = loss
         self._batch_size = batch_size
+        # A single lookup table for all the items, built once instead of dispatching
+        # on the item type in every access
+        self._lookup = {**metrics, loss.type: loss}
         self.y = y
         self.y_pred = y_pred
 
     def __getitem__(self, item: Union[BatchMetricType, LossType]):
-        if isinstance(item, BatchMetricType):
-            return self.metrics[item]
-        if isinstance(item, LossType):
-            return self.loss if self.loss.type == item else None
+        try:
+            return self._lookup[item]
+        except KeyError:
+            if isinstance(item, BatchMetricType):
+                raise
+            return None
 
     @property
     def metrics(self):
@@ -53,22 +64,123 @@ class BatchResult:
         return self._batch_size
 
 
+class BatchResultBuffer(SequenceABC):
+    """
+    A columnar container for the results of all the batches in an epoch.
+
+    Instead of retaining a BatchResult object per batch, the batch metrics and sizes
+    are written into pre-allocated arrays (a contiguous row per batch metric), and
+    BatchResult objects are only created on access. Implements the Sequence API, so it
+    can be passed wherever a sequence of BatchResult is expected.
+    """
+
+    def __init__(
+        self,
+        metric_types: Sequence[BatchMetricType],
+        num_batches: int,
+        keep_output: bool = False,
+    ):
+        """
+        Args:
+            metric_types: The types of the batch metrics, in the order of the rows
+            num_batches: Expected number of batches, the buffers are grown when needed
+            keep_output: Whether to retain the labels and predictions of the batches
+        """
+        self._metric_types = tuple(metric_types)
+        self._keep_output = keep_output
+        self._metrics = np.empty((len(self._metric_types), max(num_batches, 1)))
+        self._sizes = np.empty(max(num_batches, 1), dtype=np.int64)
+        self._losses: List[LossResult] = []
+        self._outputs: List[Tuple[Dict[LabelType, Tensor], ...]] = []
+
+    def append(
+        self, batch_result: BatchResult, metric_values: Optional[Sequence[float]] = None
+    ):
+        """
+        Adds the result of a batch to the buffer.
+
+        Args:
+            batch_result: The result of the next batch
+            metric_values: The batch metrics in the order of the metric types, if
+            already available, saves looking them up in the batch result by type
+        """
+        i = len(self._losses)
+        if i == len(self._sizes):
+            self._metrics = np.concatenate(
+                [self._metrics, np.empty_like(self._metrics)], axis=1
+            )
+            self._sizes = np.concatenate([self._sizes, np.empty_like(self._sizes)])
+
+        if metric_values is None:
+            metric_values = [batch_result.metrics[t] for t in self._metric_types]
+        self._metrics[:, i] = metric_values
+        self._sizes[i] = batch_result.batch_size
+        self._losses.append(batch_result.loss)
+        if self._keep_output:
+            self._outputs.append((batch_result.y, batch_result.y_pred))
+
+    def __len__(self):
+        return len(self._losses)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("Batch index out of range")
+
+        y, y_pred = self._outputs[idx] if self._keep_output else (None, None)
+        return BatchResult(
+            self._losses[idx],
+            dict(zip(self._metric_types, self._metrics[:, idx].tolist())),
+            int(self._sizes[idx]),
+            y,
+            y_pred,
+        )
+
+    @property
+    def metrics(self) -> Dict[BatchMetricType, Array]:
+        """The values of each batch metric in all the batches, keyed by metric type"""
+        n = len(self)
+        return {t: self._metrics[i, :n] for i, t in enumerate(self._metric_types)}
+
+    @property
+    def sizes(self) -> Array:
+        """The number of samples in each batch"""
+        return self._sizes[: len(self)]
+
+    @property
+    def losses(self) -> List[LossResult]:
+        """The loss of each batch"""
+        return self._losses
+
+
 class EpochResult:
     """
     A container for the results of a single epoch training
     """
 
+    __slots__ = (
+        "_batch_losses",
+        "_batch_metrics",
+        "_epoch_metrics",
+        "_epoch_size",
+        "_lookup",
+    )
+
     def __init__(
         self,
         batch_losses: Sequence[LossResult],
-        batch_metrics: Dict[BatchMetricType, Sequence[float]],
+        batch_metrics: Dict[BatchMetricType, Array],
         epoch_metrics: Dict[EpochMetricType, float],
         epoch_size: int,
     ):
         """
         Args:
             batch_losses: A list of the losses of all batches in the epoch
-            batch_metrics: Batch metrics for all batches in the epochs
+            batch_metrics: Batch metrics for all batches in the epochs, an array per
+            metric type
             epoch_metrics: Aggregated epoch metrics
             epoch_size: Total number of samples in the epoch
         """
@@ -76,12 +188,16 @@ class EpochResult:
         self._batch_metrics = batch_metrics
         self._epoch_metrics = epoch_metrics
         self._epoch_size = epoch_size
+        # A single lookup table for all the metrics, see BatchResult
+        self._lookup = {**batch_metrics, **epoch_metrics}
 
     def __getitem__(self, item: Union[BatchMetricType, EpochMetricType, LossType]):
-        if isinstance(item, BatchMetricType):
-            return self.batch_metrics[item]
-        if isinstance(item, EpochMetricType):
-            return self.epoch_metrics[item]
+        try:
+            return self._lookup[item]
+        except KeyError:
+            if isinstance(item, (BatchMetricType, EpochMetricType)):
+                raise
+            return None
 
     @property
     def batch_losses(self):
@@ -100,19 +216,59 @@ class EpochResult:
         return self._epoch_size
 
 
+class EpochResultsView(MappingABC):
+    """
+    A read-only mapping from epoch number to a single field of the result of that
+    epoch, computed on access from the epoch results.
+    """
+
+    def __init__(
+        self,
+        epoch_results: Mapping[int, EpochResult],
+        get: Callable[[EpochResult], Any],
+    ):
+        """
+        Args:
+            epoch_results: The results of the epochs, keyed by epoch number
+            get: Gets the field from the result of an epoch
+        """
+        self._epoch_results = epoch_results
+        self._get = get
+
+    def __getitem__(self, epoch: int):
+        return self._get(self._epoch_results[epoch])
+
+    def __iter__(self):
+        return iter(self._epoch_results)
+
+    def __len__(self):
+        return len(self._epoch_results)
+
+
 class FitResult:
     """
     A container for the results of an entire trainer model fit.
     """
 
+    __slots__ = (
+        "_batch_train_losses",
+        "_batch_validation_losses",
+        "_batch_train_metrics",
+        "_batch_validation_metrics",
+        "_epoch_train_metrics",
+        "_epoch_validation_metrics",
+        "_num_epochs",
+        "_model",
+    )
+
     def __init__(
         self,
-        batch_train_losses: Dict[int, Sequence[LossResult]],
-        batch_validation_losses: Dict[int, Sequence[LossResult]],
-        batch_train_metrics: Dict[BatchMetricType, Dict[int, Sequence[float]]],
-        batch_validation_metrics: Dict[BatchMetricType, Dict[int, Sequence[float]]],
-        epoch_train_metrics: Dict[EpochMetricType, Dict[int, float]],
-        epoch_validation_metrics: Dict[EpochMetricType, Dict[int, float]],
+        batch_train_losses: Mapping[int, Sequence[LossResult]],
+        batch_validation_losses: Mapping[int, Sequence[LossResult]],
+        batch_train_metrics: Dict[BatchMetricType, Mapping[int, Array]],
+        batch_validation_metrics: Dict[BatchMetricType, Mapping[int, Array]],
+        epoch_train_metrics: Dict[EpochMetricType, Mapping[int, float]],
+        epoch_validation_metrics: Dict[EpochMetricType, Mapping[int, float]],
         num_epochs: int,
         model: Model,
     ):
@@ -142,6 +298,59 @@ class FitResult:
         self._num_epochs = num_epochs
         self._model = model
 
+    @classmethod
+    def from_epoch_results(
+        cls,
+        train_results: Mapping[int, EpochResult],
+        validation_results: Mapping[int, EpochResult],
+        batch_metric_types: Sequence[BatchMetricType],
+        epoch_metric_types: Sequence[EpochMetricType],
+        num_epochs: int,
+        model: Model,
+    ) -> "FitResult":
+        """
+        Creates a fit result whose losses and metrics are views over the results of
+        the epochs, so nothing is copied and every entry is only looked up when
+        accessed.
+
+        Args:
+            train_results: The results of the training epochs, keyed by epoch number
+            validation_results: The results of the validation epochs, keyed by epoch
+            number
+            batch_metric_types: The types of the batch metrics in the epoch results
+            epoch_metric_types: The types of the epoch metrics in the epoch results
+            num_epochs: Total number of epochs the model was trained for.
+            model: The trained model
+
+        Returns: A FitResult viewing the epoch results
+        """
+
+        def losses(results):
+            return EpochResultsView(results, lambda r: r.batch_losses)
+
+        def batch_metrics(results):
+            return {
+                t: EpochResultsView(results, lambda r, t=t: r.batch_metrics[t])
+                for t in batch_metric_types
+            }
+
+        def epoch_metrics(results):
+            return {
+                t: EpochResultsView(results, lambda r, t=t: r.epoch_metrics[t])
+                for t in epoch_metric_types
+            }
+
+        return cls(
+            losses(train_results),
+            losses(validation_results),
+            batch_metrics(train_results),
+            batch_metrics(validation_results),
+            epoch_metrics(train_results),
+            epoch_metrics(validation_results),
+            num_epochs,
+            model,
+        )
+
     @property
     def batch_train_losses(self):
         return self._batch_train_losses
@@ -163,7 +372,7 @@ class FitResult:
         return self._epoch_train_metrics
 
     @property
-    def epoch_validation_metrics(self) -> Dict[EpochMetricType, Dict[int, float]]:
+    def epoch_validation_metrics(self) -> Dict[EpochMetricType, Mapping[int, float]]:
         return self._epoch_validation_metrics
 
     @property
@@ -1,12 +1,51 @@
+import sys
 from enum import Enum
+from functools import total_ordering
 
 
-class DataType(Enum):
-    def __lt__(self, other):
-        return self.value <= other.value
+class Name(Enum):
+    """
+    A base class for names. As enum members are singletons compared by identity, they
+    are also hashed by identity, which is much faster than the default hashing of the
+    member name when used as dictionary keys.
+    """
+
+    __hash__ = object.__hash__
+
+    def __init__(self, *args):
+        # Values are often written to and read from files (e.g. HDF5 attributes) and
+        # compared as strings, interning makes equal values the same object
+        if isinstance(self._value_, str):
+            self._value_ = sys.intern(self._value_)
+
+    @classmethod
+    def from_value(cls, value):
+        """
+        Gets a member by its value, like calling the enum, without going through the
+        enum metaclass call. Useful when deserializing many names, e.g. from HDF5
+        attributes.
+
+        Args:
+            value: The value of the member
 
-    def __le__(self, other):
-        return self.value < other.value
+        Returns: The member with the given value
+
+        Raises:
+            ValueError: If no member has the given value
+        """
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+@total_ordering
+class DataType(Name):
+    def __lt__(self, other):
+        if not isinstance(other, DataType):
+            return NotImplemented
+        # The raw value attribute, `value` is a much slower descriptor
+        return self._value_ < other._value_
 
 
 class ModelDataType(DataType):
@@ -60,25 +99,25 @@ class LabelType(DataType):
     NO_LABEL = "no label"
 
 
-class HospitalName(Enum):
+class HospitalName(Name):
     pass
 
 
-class DataBaseVersion(Enum):
+class DataBaseVersion(Name):
     V0 = "v0"
     FAKE = "fake version"
 
 
-class DataBaseProperties(Enum):
+class DataBaseProperties(Name):
     RAW = "raw"
     FOR_UNIT_TEST = "for_unit_test"
 
 
-class DataBaseName(Enum):
+class DataBaseName(Name):
     FAKE_SOURCE = "fake_source"
 
 
-class BatchMetricType(Enum):
+class BatchMetricType(Name):
     ACCURACY = "accuracy"
     NUM_CORRECT = "Number of correct classifications"
     TRUE_NEGATIVE = "Number of correct negative classifications"
@@ -92,7 +131,7 @@ class BatchMetricType(Enum):
     AUROC = "Area under ROC curve"
 
 
-class EpochMetricType(Enum):
+class EpochMetricType(Name):
     ACCURACY = "accuracy"
     PPV = "Positive predictive value"
     SENSITIVITY = "Sensitivity"
@@ -101,19 +140,19 @@ class EpochMetricType(Enum):
     AUROC = "Area under ROC curve"
 
 
-class LossType(Enum):
+class LossType(Name):
     MSE = "Mean square error"
     BCE = "Binary cross entropy"
     CROSS_ENTROPY = "Cross entropy"
     RAW = "raw"
 
 
-class CallbackType(Enum):
+class CallbackType(Name):
     PLOT_TRAINING_LOSS = "Plot the training loss"
     CHECKPOINTS = "Save checkpoints when a metric improve"
     LR_SCHEDULER = "Learning rate scheduler"
 
 
-class StopperType(Enum):
+class StopperType(Name):
     MAX_EPOCHS = "Maximal number of epochs has been reached"
     EARLY_STOPPING = "No learning progression"
@@ -1,18 +1,40 @@
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from hashlib import md5
+from functools import lru_cache, partial
 from logging import getLogger
 from pathlib import Path
-from time import time
-from typing import Union
+from secrets import token_hex
+from time import time_ns
+from typing import List, Optional, Sequence, Tuple, Union
 
 import _pickle as pickle
 import h5py
 import numpy as np
+from numpy.typing import DTypeLike
 
 from physlearn.names import HospitalName
 
 SIGNATURE_FILE_SUFFIX = ".sign"
 SIGN_DELIMITER = ":"
+# Stored in the signature cache, caches of other algorithms are recalculated
+SIGN_ALGORITHM = "blake2b"
+_SIGN_CHUNK_SIZE = 1 << 22
+# Quick signatures hash only the size and this many bytes of the head and tail of files
+QUICK_SIGN_TAG = "-quick"
+_QUICK_SIGN_SPAN = 1 << 20
+
+# Translation tables deleting the ASCII characters str.isdigit/str.isalpha reject, other
+# strings are filtered character by character to keep the unicode semantics
+_ASCII = [chr(c) for c in range(128)]
+_DELETE_NON_DIGITS = str.maketrans(
+    "", "", "".join(c for c in _ASCII if not c.isdigit())
+)
+_DELETE_NON_LETTERS = str.maketrans(
+    "", "", "".join(c for c in _ASCII if not c.isalpha())
+)
 
 
 _LOG = getLogger()
@@ -30,13 +52,12 @@ def create_time_axis(start: datetime, length: int, dt: timedelta) -> np.ndarray:
       corresponds to the sampling frequency.
 
     Returns:
-      time axis: with given length, starting from start time.
-      Time difference between consecutive samples is determined by dt.
+      time axis: a datetime64 array with given length, starting from start time.
+      Time difference between consecutive samples is determined by dt. Convert with
+      `.astype(datetime)` where datetime objects are needed.
 
     """
-    end = start + dt * length
-    time_axis = np.arange(start, end, dt).astype(datetime)
-    return time_axis
+    return np.datetime64(start) + np.arange(length) * np.timedelta64(dt)
 
 
 def find_files_with_extension(extension: str, files_path: Path):
@@ -51,7 +72,48 @@ def find_files_with_extension(extension: str, files_path: Path):
       files: a list of file paths (str) with the extension
 
     """
-    return list(Path(files_path).glob("**/*." + extension))
+    # Walks the tree with scandir like Path.glob("**/*.<extension>") (symbolic links to
+    # directories aren't followed, missing or unreadable directories are skipped),
+    # without creating a Path object for every entry
+    suffix = os.path.normcase("." + extension)
+    files = []
+    directories = [os.fspath(files_path)]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if os.path.normcase(entry.name).endswith(suffix):
+                        files.append(Path(entry.path))
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            continue
+    return files
+
+
+def mmap_signal(
+    path: Union[str, Path], offset: int, shape: Tuple[int, ...], dtype: DTypeLike
+) -> np.ndarray:
+    """
+    Maps a signal saved as raw binary data in a file to a read-only array.
+
+    The data is not read until it is accessed, and then only the pages actually
+    touched are read, so the array can be passed to `Signal` without copying.
+
+    Args:
+      path: path of the file
+      offset: offset of the signal from the beginning of the file in bytes
+      shape: shape of the signal, e.g. [channels, time steps]
+      dtype: dtype of the saved signal
+
+    Returns:
+      A read-only memory mapped array of the signal.
+
+    """
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
 
 
 def check_hdf5_file_validity(path):
@@ -75,6 +137,8 @@ def find_digits_in_str(string: str) -> str:
       digits: str, found in the given string
 
     """
+    if string.isascii():
+        return string.translate(_DELETE_NON_DIGITS)
     return "".join(x for x in string if x.isdigit())
 
 
@@ -123,20 +187,23 @@ def safe_pickle(directory: str, file_name: str, obj):
         obj: The object to pickle
 
     """
-    # Adding time signature to make the file name unique
-    time_signature = str(hex(int(time() * 1000)))[2:]
-
-    path = directory + file_name + f"{time_signature}.pkl"
-
-    if Path(path).exists():
+    # Adding time and random signatures to make the file name unique, even for
+    # concurrent writers
+    signature = f"{time_ns():x}_{token_hex(4)}"
+
+    path = directory + file_name + f"{signature}.pkl"
+
+    # Save the file with the highest protocol (5 since Python 3.8), which writes large
+    # arrays (e.g. numpy) without an intermediate copy. The exclusive mode atomically
+    # refuses to overwrite an existing file
+    try:
+        with open(path, "xb") as f:
+            pickle.dump(obj, f, protocol=-1)
+    except FileExistsError:
         raise RuntimeError(
             "Could not create a unique name, please try again, should "
             "probably work then"
-        )
-
-    # Save the file
-    with open(directory + file_name + f"{time_signature}.pkl", "wb") as f:
-        pickle.dump(obj, f)
+        ) from None
 
 
 def find_letters_in_str(string: str) -> str:
@@ -149,11 +216,12 @@ def find_letters_in_str(string: str) -> str:
       letters: str, found in the given string
 
     """
-    letters = "".join(x for x in string if x.isalpha())
-    return letters
+    if string.isascii():
+        return string.translate(_DELETE_NON_LETTERS)
+    return "".join(x for x in string if x.isalpha())
 
 
-def cached_sign(path: Path) -> str:
+def cached_sign(path: Path, quick: bool = False) -> str:
     """Signs files using signature cache
 
     Tries to load the signature from a signature cache. If signature cache exists
@@ -164,32 +232,115 @@ def cached_sign(path: Path) -> str:
 
     Args:
         path: path of the file to sign
+        quick: sign only the size, head and tail of the file instead of its entire
+        content. Much faster for large recordings, but only fit for telling files
+        apart (e.g. cache invalidation), not for verifying their integrity.
 
-    Returns: File md5 signature as a string
+    Returns: File BLAKE2b signature as a string
 
     """
+    # Signatures are also cached in memory, keyed by the modification time and size of
+    # the file, so repeated calls for an unchanged file take a single stat
+    stat = path.stat()
+    return _cached_sign(path, stat.st_mtime_ns, stat.st_size, quick)
+
+
+def sign_files(
+    paths: Sequence[Path], quick: bool = False, max_workers: Optional[int] = None
+) -> List[str]:
+    """Signs multiple files in parallel using signature cache
+
+    Files are signed by `cached_sign` in a thread pool. Hashing memory mapped files
+    releases the GIL, so signing scales with the number of cores.
+
+    Args:
+        paths: paths of the files to sign
+        quick: sign only the size, head and tail of the files, see `cached_sign`
+        max_workers: maximal number of threads, defaults to the ThreadPoolExecutor
+        default
+
+    Returns: The signatures of the files, in the order of the paths
 
+    """
+    # Each file is signed once, so that workers don't write the same signature file
+    # concurrently
+    unique_paths = list(dict.fromkeys(paths))
+    with ThreadPoolExecutor(max_workers) as executor:
+        signs = executor.map(partial(cached_sign, quick=quick), unique_paths)
+        path_signs = dict(zip(unique_paths, signs))
+    return [path_signs[p] for p in paths]
+
+
+@lru_cache(maxsize=4096)
+def _cached_sign(path: Path, mtime_ns: int, size: int, quick: bool) -> str:
+    """Signs a file using the signature cache file, see `cached_sign`"""
     sign_file = path.with_suffix(SIGNATURE_FILE_SUFFIX)
-    last_modified = str(path.stat().st_mtime_ns)
+    last_modified = str(mtime_ns)
+    algorithm = SIGN_ALGORITHM + QUICK_SIGN_TAG if quick else SIGN_ALGORITHM
     if sign_file.is_file():
         with sign_file.open("rt") as sf:
-            last_modified_cache, sign = sf.read().split(SIGN_DELIMITER)
-            if last_modified == last_modified_cache:
-                return sign
+            cached = sf.read().split(SIGN_DELIMITER)
+            if cached[:2] == [last_modified, algorithm]:
+                return cached[2]
             else:
                 _LOG.info("File changed since last signing, recalculating signature.")
 
     with path.open(mode="rb") as f:
         _LOG.info(f"calculating signature for file {path}")
-        file_hash = md5()
-        chunk = f.read(8192)
-        while chunk:
-            file_hash.update(chunk)
-            chunk = f.read(8192)
-    sign = file_hash.hexdigest()
+        sign = _quick_file_digest(f, size) if quick else _file_digest(f)
 
     with sign_file.open("wt") as sf:
-        sf.write(last_modified + SIGN_DELIMITER + sign)
+        sf.write(SIGN_DELIMITER.join((last_modified, algorithm, sign)))
     sign_file.chmod(0o777)
 
     return sign
+
+
+def _quick_file_digest(f, size: int) -> str:
+    """Hashes the size, head and tail of a binary file object with SIGN_ALGORITHM
+
+    Args:
+        f: a file object opened for reading in binary mode
+        size: the size of the file in bytes
+
+    Returns: The hex digest of the file size, head and tail
+
+    """
+    file_hash = hashlib.new(SIGN_ALGORITHM)
+    file_hash.update(size.to_bytes(8, "little"))
+    file_hash.update(f.read(_QUICK_SIGN_SPAN))
+    if size > 2 * _QUICK_SIGN_SPAN:
+        f.seek(-_QUICK_SIGN_SPAN, os.SEEK_END)
+    file_hash.update(f.read())
+    return file_hash.hexdigest()
+
+
+def _file_digest(f) -> str:
+    """Hashes a binary file object with SIGN_ALGORITHM
+
+    Memory maps the file and hashes it with a single update, so the hashing loop runs
+    in C without copying the file to Python buffers. Files that can't be memory mapped
+    (empty files, streams) are read into a single reused buffer.
+
+    Args:
+        f: a file object opened for reading in binary mode
+
+    Returns: The hex digest of the file contents
+
+    """
+    file_hash = hashlib.new(SIGN_ALGORITHM)
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            file_hash.update(mapped)
+        return file_hash.hexdigest()
+    except (OSError, ValueError):
+        pass
+
+    buffer = bytearray(_SIGN_CHUNK_SIZE)
+    view = memoryview(buffer)
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        file_hash.update(view[:size])
+    return file_hash.hexdigest()
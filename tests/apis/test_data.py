@@ -1,9 +1,15 @@
 import pytest
 
-from physlearn.apis.data import Signal
-from physlearn.names import SignalType
+import numpy as np
+import torch
+
+from physlearn.apis.data import Signal, SignalTable, compare_tensor_dict
+from physlearn.names import NonSignalDataType, SignalType
 from tests.test_classes.data import FakeDataSource
 
+# The message of setting a property without a setter differs between Python versions
+SET_ATTRIBUTE_ERROR = r"can't set attribute|has no setter"
+
 
 @pytest.fixture
 def sample():
@@ -17,17 +23,17 @@ def example_signal(sample):
 
 class TestSignal:
     def test_data_safety(self, example_signal: Signal):
-        with pytest.raises(AttributeError, match=r"can't set attribute"):
+        with pytest.raises(AttributeError, match=SET_ATTRIBUTE_ERROR):
             example_signal.start_time = 17
-        with pytest.raises(AttributeError, match=r"can't set attribute"):
+        with pytest.raises(AttributeError, match=SET_ATTRIBUTE_ERROR):
             example_signal.start_time = 17
-        with pytest.raises(AttributeError, match=r"can't set attribute"):
+        with pytest.raises(AttributeError, match=SET_ATTRIBUTE_ERROR):
             example_signal.end_time = 17
-        with pytest.raises(AttributeError, match=r"can't set attribute"):
+        with pytest.raises(AttributeError, match=SET_ATTRIBUTE_ERROR):
             example_signal.time_axis = 17
-        with pytest.raises(AttributeError, match=r"can't set attribute"):
+        with pytest.raises(AttributeError, match=SET_ATTRIBUTE_ERROR):
             example_signal.signal = 17
-        with pytest.raises(AttributeError, match=r"can't set attribute"):
+        with pytest.raises(AttributeError, match=SET_ATTRIBUTE_ERROR):
             example_signal.signal_type = 17
 
     def test_data_validation(self, example_signal: Signal):
@@ -35,7 +41,7 @@ class TestSignal:
             Signal(
                 start_time=example_signal.start_time,
                 end_time=example_signal.end_time,
-                time_axis=example_signal.time_axis[:, 0:17],
+                time_axis=example_signal.time_axis[0:17],
                 signal=example_signal.signal,
                 signal_type=example_signal.signal_type,
             )
@@ -51,6 +57,36 @@ class TestSignal:
     def test_getitem(self, example_signal):
         assert (example_signal.signal == example_signal[:, :]).all()
 
+    def test_time_axis_shape(self, example_signal):
+        time_steps = example_signal.signal.shape[1]
+        assert example_signal.time_axis.shape == (time_steps,)
+        assert example_signal.time_axis_2d.shape == (1, time_steps)
+        assert np.shares_memory(example_signal.time_axis, example_signal.time_axis_2d)
+        assert example_signal == example_signal.signal_like_this(
+            time_axis=example_signal.time_axis_2d
+        )
+
+    def test_slots(self, example_signal):
+        assert not hasattr(example_signal, "__dict__")
+        with pytest.raises(AttributeError):
+            example_signal.new_attribute = 17
+
+    def test_read_only_views(self, example_signal):
+        with pytest.raises(ValueError, match=r"read-only"):
+            example_signal.signal[0, 0] = 17
+        with pytest.raises(ValueError, match=r"read-only"):
+            example_signal.time_axis[0] = 17
+        with pytest.raises(ValueError, match=r"read-only"):
+            example_signal[:, :10][0, 0] = 17
+        with pytest.raises(ValueError, match=r"read-only"):
+            example_signal[::1, 5:100:7][0, 0] = 17
+        fancy = example_signal[:, [0, 2, 4]]
+        fancy[0, 0] = 17
+        assert fancy.flags.writeable
+        copied = example_signal.signal_copy()
+        copied[0, 0] = example_signal.signal[0, 0] + 1
+        assert copied[0, 0] != example_signal.signal[0, 0]
+
     def test_comparison(self, example_signal):
         equal_sig = Signal(
             start_time=example_signal.start_time,
@@ -60,7 +96,7 @@ class TestSignal:
             signal_type=example_signal.signal_type,
         )
 
-        different_signal = example_signal.signal
+        different_signal = example_signal.signal_copy()
         different_signal[0, 17] = 17
         non_equal_sig = Signal(
             start_time=example_signal.start_time,
@@ -73,8 +109,174 @@ class TestSignal:
         assert example_signal == equal_sig
         assert example_signal != non_equal_sig
 
+    def test_signal_like_this_subclass_state(self, example_signal):
+        class ExtraSignal(Signal):
+            def __init__(self, extra, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.extra = extra
+
+        other = ExtraSignal(
+            5,
+            start_time=example_signal.start_time,
+            end_time=example_signal.end_time,
+            time_axis=example_signal.time_axis,
+            signal=example_signal.signal,
+            signal_type=example_signal.signal_type,
+        )
+        like = other.signal_like_this(start_time=example_signal.start_time)
+        assert type(like) is ExtraSignal
+        assert like.extra == 5
+        assert like.signal_like_this(signal=example_signal.signal_copy()).extra == 5
+
+    def test_signal_like_this(self, example_signal):
+        class OtherSignal(Signal):
+            pass
+
+        other = OtherSignal._unchecked(
+            start_time=example_signal.start_time,
+            end_time=example_signal.end_time,
+            time_axis=example_signal.time_axis,
+            signal=example_signal.signal,
+            signal_type=example_signal.signal_type,
+        )
+        like = other.signal_like_this(signal_type=SignalType.Unknown)
+        assert type(like) is OtherSignal
+        assert like.signal_type == SignalType.Unknown
+        with pytest.raises(ValueError, match=r"Illegal signal dimensions"):
+            other.signal_like_this(signal=example_signal.signal[:, :17])
+        with pytest.raises(ValueError, match=r"can't be before"):
+            other.signal_like_this(end_time=example_signal.start_time)
+        with pytest.raises(ValueError, match=r"mismatch channel names"):
+            other.signal_like_this(channel_names=("a", "b"))
+
+    def test_storage_dtype(self, example_signal):
+        half = Signal(
+            start_time=example_signal.start_time,
+            end_time=example_signal.end_time,
+            time_axis=example_signal.time_axis,
+            signal=example_signal.signal,
+            signal_type=example_signal.signal_type,
+            storage_dtype=np.float16,
+        )
+        assert half.signal.dtype == np.float16
+        assert np.shares_memory(half.signal_as(np.float16), half.signal)
+        assert half.signal_as(np.float32).dtype == np.float32
+        assert np.allclose(
+            half.signal_as(np.float32), example_signal.signal, rtol=1e-3, atol=1e-3
+        )
+        assert half.signal_like_this(signal_type=SignalType.ECG).signal.dtype == (
+            np.float16
+        )
+        like = half.signal_like_this(signal=example_signal.signal_copy())
+        assert like.signal.dtype == np.float16
+        assert np.shares_memory(like.signal_as(np.float16), like.signal)
+
+    def test_signal_like_this_keeps_dtype(self, example_signal):
+        int_signal = example_signal.signal_like_this(
+            signal=np.zeros(example_signal.signal.shape, dtype=np.int64)
+        )
+        assert int_signal.signal.dtype == np.int64
+        replacement = np.full(example_signal.signal.shape, 0.5)
+        like = int_signal.signal_like_this(signal=replacement)
+        assert like.signal.dtype == np.float64
+        assert np.array_equal(like.signal, replacement)
+
+    def test_bulk_construct(self, example_signal):
+        record = dict(
+            start_time=example_signal.start_time,
+            end_time=example_signal.end_time,
+            time_axis=example_signal.time_axis,
+            signal=example_signal.signal,
+            signal_type=example_signal.signal_type,
+        )
+        assert Signal.bulk_construct([record, record]) == [example_signal] * 2
+        assert Signal.bulk_construct([]) == []
+        with pytest.raises(ValueError, match=r"Illegal signal dimensions"):
+            Signal.bulk_construct(
+                [record, {**record, "time_axis": record["time_axis"][:17]}]
+            )
+        with pytest.raises(ValueError, match=r"can't be before"):
+            Signal.bulk_construct(
+                [{**record, "end_time": record["start_time"]}, record]
+            )
+        with pytest.raises(ValueError, match=r"mismatch channel names"):
+            Signal.bulk_construct([record, {**record, "channel_names": ("a", "b")}])
+
+    def test_find_channel(self, example_signal):
+        signal = example_signal.signal_like_this(
+            signal=np.zeros((3, example_signal.signal.shape[1])),
+            channel_names=("Fz", "Cz", "Fz"),
+        )
+        assert signal.find_channel("Fz") == (0, 2)
+        assert signal.find_channel("Cz") == (1,)
+        with pytest.raises(ValueError, match=r"not found"):
+            signal.find_channel("Pz")
+
+
+class TestSignalTable:
+    def test_round_trip(self):
+        source = FakeDataSource()
+        signals = [
+            sample.signals[SignalType.FAKE]
+            for sample in source.get_samples(source.sample_index_array[:5])
+        ]
+        table = SignalTable.from_signals(signals)
+        assert len(table) == len(signals)
+        assert table.data.shape == (len(signals),) + signals[0].signal.shape
+        assert table.time_axis.shape == (len(signals), signals[0].time_axis.size)
+        assert list(table.iter_signals()) == signals
+
+    def test_validation(self, example_signal):
+        with pytest.raises(ValueError, match=r"same type"):
+            SignalTable.from_signals(
+                [
+                    example_signal,
+                    example_signal.signal_like_this(signal_type=SignalType.ECG),
+                ]
+            )
+        with pytest.raises(ValueError, match=r"without signals"):
+            SignalTable.from_signals([])
+
 
 class TestSample:
+    def test_slots(self, sample):
+        assert not hasattr(sample, "__dict__")
+
     def test_sample_like(self, sample):
         assert sample == sample.sample_like_this()
         assert not sample == sample.sample_like_this(patient_id=17)
+
+    def test_comparison_keys(self, sample):
+        assert not sample == sample.sample_like_this(label={})
+        assert not sample == sample.sample_like_this(
+            data={NonSignalDataType.AGE: np.zeros(1), **sample.data}
+        )
+
+    def test_comparison_keys_mutated(self, sample):
+        other = sample.sample_like_this(data=dict(sample.data))
+        other.data[NonSignalDataType.AGE] = np.zeros(1)
+        assert not sample == other
+        del other.data[NonSignalDataType.AGE]
+        assert sample == other
+
+    def test_sample_like_falsy_values(self, sample):
+        other = sample.sample_like_this(patient_id=17, sample_id=17)
+        like = other.sample_like_this(patient_id=0, sample_id=0, data={})
+        assert like.patient_id == 0
+        assert like.sample_id == 0
+        assert like.data == {}
+
+
+def test_compare_tensor_dict():
+    a, b = np.arange(3), np.arange(4)
+    assert compare_tensor_dict({1: a, 2: b}, {2: b.copy(), 1: a.copy()})
+    assert not compare_tensor_dict({1: a, 2: b}, {1: a, 3: b})
+    assert not compare_tensor_dict({1: a, 2: b}, {1: a, 2: b[::-1]})
+    assert not compare_tensor_dict({1: a}, {1: b})
+
+
+def test_compare_tensor_dict_grad_tensors():
+    a = torch.arange(3.0, requires_grad=True)
+    assert compare_tensor_dict({1: a}, {1: a.detach().clone().requires_grad_()})
+    assert not compare_tensor_dict({1: a}, {1: a.detach() + 1})
+    assert not compare_tensor_dict({1: a}, {1: torch.arange(4.0)})
@@ -0,0 +1,101 @@
+import pytest
+
+import numpy as np
+import torch
+
+from physlearn.apis.data_loading import DataSchema, DataSource
+from physlearn.names import LabelType, NonSignalDataType, SignalType
+from tests.test_classes.data import FakeDataSource, OtherFakeDataSource
+
+
+@pytest.fixture
+def source():
+    return FakeDataSource()
+
+
+class TestDataSource:
+    def test_sample_ids(self, source):
+        sample_ids = list(source.sample_ids)
+        assert len(sample_ids) == len(source)
+        assert sample_ids == list(source.sample_ids)
+        for idx in sample_ids:
+            assert source[idx].sample_id == idx[2]
+
+    def test_samples_created_once(self, source):
+        assert source[0, 0, 0] is source[0, 0, 0]
+
+    def test_samples_read_only(self, source):
+        sample = source[0, 0, 0]
+        with pytest.raises(ValueError, match=r"read-only"):
+            sample.data[NonSignalDataType.FAKE] += 1
+        with pytest.raises(TypeError):
+            sample.label[LabelType.FAKE] = None
+
+    def test_single_precision_signals(self, source):
+        signal = source[0, 0, 0].signals[SignalType.FAKE]
+        assert signal.signal.dtype == np.float32
+
+    def test_sample_index_array(self, source):
+        index = source.sample_index_array
+        assert index.shape == (len(source), 3)
+        assert index is source.sample_index_array
+        assert [tuple(row) for row in index.tolist()] == list(source.sample_ids)
+
+    def test_global_to_local(self, source):
+        sample_ids = list(source.sample_ids)
+        for i in (0, len(sample_ids) // 2, len(sample_ids) - 1):
+            assert source.global_to_local(i) == sample_ids[i]
+        assert list(source.patient_id_array) == list(source.patient_ids)
+
+    def test_signature_is_cached(self):
+        class SigningSource(FakeDataSource):
+            signature = DataSource.signature
+            sign_calls = 0
+
+            def _sign(self):
+                self.sign_calls += 1
+                return "signed"
+
+        source = SigningSource()
+        assert source.signature == source.signature == "signed"
+        assert source.sign_calls == 1
+
+    def test_get_samples(self, source):
+        index = source.sample_index_array[::2]
+        samples = source.get_samples(index)
+        assert len(samples) == len(index)
+        for idx, sample in zip(index.tolist(), samples):
+            assert sample == source[tuple(idx)]
+        assert source.get_samples([(0, 0, 0)]) == [source[0, 0, 0]]
+
+
+class TestDataSchema:
+    def test_from_sources(self):
+        schema = DataSchema.from_sources([FakeDataSource(), OtherFakeDataSource()])
+        assert schema.data_types == (
+            SignalType.FAKE,
+            NonSignalDataType.FAKE,
+            NonSignalDataType.NON_SIGNAL_DATA,
+        )
+        assert schema.label_types == (LabelType.FAKE,)
+
+    def test_collate(self, source):
+        schema = DataSchema.from_sources([source])
+        samples = [
+            (
+                {
+                    SignalType.FAKE: torch.rand(1, 10),
+                    NonSignalDataType.FAKE: torch.rand(7),
+                },
+                {LabelType.FAKE: torch.rand(2)},
+            )
+            for _ in range(4)
+        ]
+        x, y = schema.collate([schema.pack(*sample) for sample in samples])
+        assert x.keys() == samples[0][0].keys()
+        assert y.keys() == samples[0][1].keys()
+        assert x[SignalType.FAKE].shape == (4, 1, 10)
+        assert y[LabelType.FAKE].shape == (4, 2)
+        assert torch.equal(
+            x[NonSignalDataType.FAKE][2], samples[2][0][NonSignalDataType.FAKE]
+        )
@@ -0,0 +1,22 @@
+import torch
+
+from physlearn.apis.labeling import Labeler
+from physlearn.names import LabelType
+from tests.test_classes.data import FakeDataSource
+
+
+class NoLabeler(Labeler):
+    def create_label(self, x, metadata):
+        return {LabelType.NO_LABEL: torch.zeros(7)}
+
+    @property
+    def label_type(self):
+        return (LabelType.NO_LABEL,)
+
+
+def test_labeler_adds_label():
+    sample = FakeDataSource()[0, 0, 0]
+    labeled = NoLabeler()(sample, metadata=None)
+    assert labeled.label.keys() == {LabelType.FAKE, LabelType.NO_LABEL}
+    assert labeled.label[LabelType.FAKE] is sample.label[LabelType.FAKE]
+    assert sample.label.keys() == {LabelType.FAKE}
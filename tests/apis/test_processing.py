@@ -0,0 +1,65 @@
+import pytest
+
+import numpy as np
+
+from physlearn.apis.processing import Processor
+from physlearn.names import NonSignalDataType
+from tests.test_classes.data import FakeDataSource
+
+
+@pytest.fixture
+def sample():
+    return FakeDataSource()[0, 0, 0]
+
+
+class IdentityProcessor(Processor):
+    pass
+
+
+class FeatureProcessor(Processor):
+    def _extract_features(self, signals, **kwargs):
+        return {NonSignalDataType.AGE: np.ones(1)}
+
+
+class FusedProcessor(Processor):
+    def _fused_process(self, x, **kwargs):
+        signals = {}
+        data = dict(x.data)
+        for signal_type, signal in x.signals.items():
+            signals[signal_type] = signal.signal_like_this(signal=signal.signal * 2)
+            data[NonSignalDataType.AGE] = signals[signal_type].signal.mean(
+                keepdims=True
+            )
+        return x.sample_like_this(signals=signals, data=data)
+
+
+class TestProcessor:
+    def test_abstract_instantiation(self):
+        with pytest.raises(TypeError, match=r"shouldn't be instantiated"):
+            Processor()
+
+    def test_identity(self, sample):
+        processor = IdentityProcessor()
+        assert not processor._processes_signals
+        assert not processor._extracts_features
+        assert processor._is_identity
+        assert processor(sample) is sample
+
+    def test_extract_features(self, sample):
+        processor = FeatureProcessor()
+        assert processor._extracts_features
+        assert not processor._processes_data
+        assert not processor._is_identity
+        processed = processor(sample)
+        assert processed.data.keys() == {*sample.data, NonSignalDataType.AGE}
+        assert processed.signals == sample.signals
+
+    def test_fused_process(self, sample):
+        assert not FusedProcessor._is_identity
+        processed = FusedProcessor()(sample)
+        assert processed.signals.keys() == sample.signals.keys()
+        for signal_type, signal in sample.signals.items():
+            np.testing.assert_array_equal(
+                processed.signals[signal_type].signal, signal.signal * 2
+            )
+        assert NonSignalDataType.AGE in processed.data
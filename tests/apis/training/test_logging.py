@@ -0,0 +1,127 @@
+import pytest
+
+from physlearn.apis.training.logging import Logger
+from physlearn.names import BatchMetricType, EpochMetricType
+from tests.test_classes.training import (
+    FakeAccuracy,
+    FakeEpochAccuracy,
+    FakeLossResult,
+    FakeNumCorrect,
+    FakeVectorizedEpochAccuracy,
+    fake_batch,
+)
+
+
+@pytest.fixture
+def logger():
+    return Logger(
+        batch_metrics=[FakeAccuracy(), FakeNumCorrect()],
+        epoch_metrics=[FakeEpochAccuracy()],
+    )
+
+
+def run_epoch(logger, epoch, train, num_batches=3, expected_batches=None):
+    logger.start_epoch(
+        train=train,
+        validation=not train,
+        current_epoch=epoch,
+        num_batches=expected_batches,
+    )
+    batch_results = [
+        logger.new_batch(FakeLossResult(float(i)), *fake_batch(), batch_size=8)
+        for i in range(num_batches)
+    ]
+    return batch_results, logger.finish_epoch()
+
+
+class TestLogger:
+    def test_epoch(self, logger):
+        batch_results, epoch_result = run_epoch(logger, 0, train=True)
+        accuracies = [b[BatchMetricType.ACCURACY] for b in batch_results]
+        assert list(epoch_result[BatchMetricType.ACCURACY]) == accuracies
+        assert epoch_result[EpochMetricType.ACCURACY] == pytest.approx(
+            sum(accuracies) / len(accuracies)
+        )
+        assert [loss.value for loss in epoch_result.batch_losses] == [0.0, 1.0, 2.0]
+        assert epoch_result.epoch_size == 24
+        assert logger.train_epochs_run == 1
+
+    def test_fit(self, logger):
+        results = {}
+        for epoch in range(2):
+            results[epoch, True] = run_epoch(logger, epoch, train=True)[1]
+            results[epoch, False] = run_epoch(logger, epoch, train=False)[1]
+        fit_result = logger.finish_training(model=None)
+
+        for epoch in range(2):
+            train, validation = results[epoch, True], results[epoch, False]
+            for metric in BatchMetricType.ACCURACY, BatchMetricType.NUM_CORRECT:
+                assert list(fit_result.batch_train_metrics[metric][epoch]) == list(
+                    train[metric]
+                )
+                assert list(fit_result.batch_validation_metrics[metric][epoch]) == list(
+                    validation[metric]
+                )
+            assert (
+                fit_result.epoch_train_metrics[EpochMetricType.ACCURACY][epoch]
+                == train[EpochMetricType.ACCURACY]
+            )
+            assert (
+                fit_result.epoch_validation_metrics[EpochMetricType.ACCURACY][epoch]
+                == validation[EpochMetricType.ACCURACY]
+            )
+            assert [loss.value for loss in fit_result.batch_train_losses[epoch]] == [
+                0.0,
+                1.0,
+                2.0,
+            ]
+        assert logger.train_epochs_run == logger.validation_epochs_run == 2
+
+        run_epoch(logger, 2, train=True)
+        assert len(fit_result.batch_train_losses) == 2
+        assert 2 not in fit_result.epoch_train_metrics[EpochMetricType.ACCURACY]
+
+    def test_metric_buffer_growth(self, logger):
+        batch_results, epoch_result = run_epoch(
+            logger, 0, train=True, num_batches=5, expected_batches=1
+        )
+        assert list(epoch_result[BatchMetricType.NUM_CORRECT]) == [
+            b[BatchMetricType.NUM_CORRECT] for b in batch_results
+        ]
+
+    def test_output_retention(self, logger):
+        batch_results, _ = run_epoch(logger, 0, train=True)
+        assert batch_results[0].y is None and batch_results[0].y_pred is None
+
+        class OutputMetric(FakeEpochAccuracy):
+            requires_output = True
+
+        logger = Logger(batch_metrics=[FakeAccuracy()], epoch_metrics=[OutputMetric()])
+        batch_results, _ = run_epoch(logger, 0, train=True)
+        assert batch_results[0].y is not None and batch_results[0].y_pred is not None
+
+        y, y_pred = fake_batch()
+        y_pred = {k: v.double().requires_grad_() for k, v in y_pred.items()}
+        batch_result = logger.new_batch(FakeLossResult(0.0), y, y_pred, batch_size=8)
+        assert not any(v.requires_grad for v in batch_result.y_pred.values())
+
+    def test_vectorized_epoch_metric(self):
+        logger = Logger(
+            batch_metrics=[FakeAccuracy()],
+            epoch_metrics=[FakeVectorizedEpochAccuracy()],
+        )
+        batch_results, epoch_result = run_epoch(logger, 0, train=True)
+        assert epoch_result[EpochMetricType.ACCURACY] == pytest.approx(
+            FakeEpochAccuracy()(batch_results)
+        )
+
+    def test_missing_batch_metric(self):
+        with pytest.raises(IndexError, match=r"missing"):
+            Logger(
+                batch_metrics=[FakeNumCorrect()],
+                epoch_metrics=[FakeVectorizedEpochAccuracy()],
+            )
+
+    def test_epoch_mode(self, logger):
+        with pytest.raises(ValueError, match=r"either train or validation"):
+            logger.start_epoch(train=True, validation=True, current_epoch=0)
@@ -0,0 +1,35 @@
+import pytest
+
+from physlearn.apis.training.metrics import BatchMetric
+from physlearn.names import BatchMetricType, LabelType
+from tests.test_classes.training import (
+    FakeAccuracy,
+    FakeEpochAccuracy,
+    FakeNumCorrect,
+    fake_batch,
+)
+
+
+def test_batch_eval():
+    y, y_pred = fake_batch()
+    metrics = [FakeAccuracy(), FakeNumCorrect()]
+    results = BatchMetric.batch_eval(metrics, y, y_pred)
+    assert results == {m.type: m(y, y_pred) for m in metrics}
+    assert all(type(v) is float for v in results.values())
+    num_correct = (y[LabelType.FAKE] == y_pred[LabelType.FAKE]).sum().item()
+    assert results[BatchMetricType.NUM_CORRECT] == num_correct
+    assert results[BatchMetricType.ACCURACY] == num_correct / len(y[LabelType.FAKE])
+
+
+def test_check_batch_metrics():
+    metric = FakeEpochAccuracy()
+    metric.check_batch_metrics({BatchMetricType.ACCURACY, BatchMetricType.NUM_CORRECT})
+    with pytest.raises(IndexError, match=r"missing"):
+        metric.check_batch_metrics({BatchMetricType.NUM_CORRECT})
+
+
+def test_batch_values():
+    y, y_pred = fake_batch()
+    metrics = [FakeNumCorrect(), FakeAccuracy()]
+    values = BatchMetric.batch_values(metrics, y, y_pred)
+    assert values == [m(y, y_pred) for m in metrics]
@@ -0,0 +1,117 @@
+import pytest
+
+import numpy as np
+
+from physlearn.apis.training.results import (
+    BatchResult,
+    BatchResultBuffer,
+    EpochResult,
+    FitResult,
+)
+from physlearn.names import BatchMetricType, EpochMetricType, LossType
+from tests.test_classes.training import FakeLossResult, fake_batch
+
+METRIC_TYPES = [BatchMetricType.ACCURACY, BatchMetricType.NUM_CORRECT]
+
+
+def make_batch_result(i, with_output=False):
+    y, y_pred = fake_batch() if with_output else (None, None)
+    return BatchResult(
+        FakeLossResult(float(i)),
+        {BatchMetricType.ACCURACY: i / 10, BatchMetricType.NUM_CORRECT: float(i)},
+        i + 1,
+        y,
+        y_pred,
+    )
+
+
+class TestBatchResultBuffer:
+    def test_append_and_growth(self):
+        buffer = BatchResultBuffer(METRIC_TYPES, num_batches=2)
+        for i in range(5):
+            buffer.append(make_batch_result(i))
+
+        assert len(buffer) == 5
+        np.testing.assert_array_equal(buffer.sizes, [1, 2, 3, 4, 5])
+        np.testing.assert_allclose(
+            buffer.metrics[BatchMetricType.ACCURACY], [0, 0.1, 0.2, 0.3, 0.4]
+        )
+        assert [loss.value for loss in buffer.losses] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_sequence_access(self):
+        buffer = BatchResultBuffer(METRIC_TYPES, num_batches=4)
+        for i in range(3):
+            buffer.append(make_batch_result(i, with_output=True))
+
+        assert buffer[-1].batch_size == 3
+        assert buffer[1].metrics == {
+            BatchMetricType.ACCURACY: 0.1,
+            BatchMetricType.NUM_CORRECT: 1.0,
+        }
+        assert buffer[0].y is None and buffer[0].y_pred is None
+        assert [b.batch_size for b in buffer[1:]] == [2, 3]
+        assert [b.batch_size for b in buffer] == [1, 2, 3]
+        with pytest.raises(IndexError):
+            buffer[3]
+
+    def test_keep_output(self):
+        buffer = BatchResultBuffer(METRIC_TYPES, num_batches=1, keep_output=True)
+        buffer.append(make_batch_result(0, with_output=True))
+        assert buffer[0].y is not None and buffer[0].y_pred is not None
+
+
+def test_slots():
+    batch_result = make_batch_result(0)
+    epoch_result = EpochResult([batch_result.loss], {}, {}, 1)
+    for result in (batch_result, batch_result.loss, epoch_result):
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.new_attribute = 17
+
+
+def test_getitem():
+    batch_result = make_batch_result(2)
+    assert batch_result[BatchMetricType.ACCURACY] == 0.2
+    assert batch_result[LossType.RAW] is batch_result.loss
+    assert batch_result[LossType.CROSS_ENTROPY] is None
+    with pytest.raises(KeyError):
+        batch_result[BatchMetricType.PPV]
+
+    epoch_result = EpochResult(
+        [batch_result.loss],
+        {BatchMetricType.ACCURACY: np.array([0.2])},
+        {EpochMetricType.ACCURACY: 0.2},
+        3,
+    )
+    assert epoch_result[EpochMetricType.ACCURACY] == 0.2
+    np.testing.assert_array_equal(epoch_result[BatchMetricType.ACCURACY], [0.2])
+    assert epoch_result[LossType.RAW] is None
+    with pytest.raises(KeyError):
+        epoch_result[BatchMetricType.PPV]
+
+
+def test_fit_result_from_epoch_results():
+    epoch_results = {
+        epoch: EpochResult(
+            [FakeLossResult(float(epoch))],
+            {BatchMetricType.ACCURACY: np.array([epoch / 10])},
+            {EpochMetricType.ACCURACY: epoch / 10},
+            1,
+        )
+        for epoch in range(3)
+    }
+    fit_result = FitResult.from_epoch_results(
+        epoch_results,
+        {},
+        [BatchMetricType.ACCURACY],
+        [EpochMetricType.ACCURACY],
+        num_epochs=3,
+        model=None,
+    )
+    accuracies = fit_result.epoch_train_metrics[EpochMetricType.ACCURACY]
+    assert dict(accuracies) == {0: 0.0, 1: 0.1, 2: 0.2}
+    assert fit_result.batch_train_losses[2][0].value == 2.0
+    assert list(fit_result.batch_train_metrics[BatchMetricType.ACCURACY]) == [0, 1, 2]
+    assert len(fit_result.batch_validation_losses) == 0
+    with pytest.raises(KeyError):
+        fit_result.batch_validation_metrics[BatchMetricType.ACCURACY][0]
@@ -1,10 +1,10 @@
 from datetime import timedelta
-from typing import Any, Dict, Sequence, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-import torch
 from numpy import linspace
-from numpy.random import randint, randn
+from numpy.random import Generator, default_rng, randint
 
 from physlearn.apis.data import Sample, Signal
 from physlearn.apis.data_loading import DataSource
@@ -17,53 +17,81 @@ from physlearn.names import (
 )
 
 
+def _read_only_block(rng: Generator, num_rows: int) -> np.ndarray:
+    block = rng.random((num_rows, 7), dtype=np.float32)
+    block.flags.writeable = False
+    return block
+
+
 class FakeDataSource(DataSource):
     def __init__(self):
 
         self._number_of_patients = randint(10, 20)
-        self._patient_ids = tuple(list(range(self.number_of_patients)))
+        self._patient_ids = tuple(range(self.number_of_patients))
         self._num_records_per_patient = randint(2, 20, self.number_of_patients)
         self._num_samples_per_record = [
             randint(1, 5, r) for r in self._num_records_per_patient
         ]
         self._record_ids = {p: self.record_ids_per_patient(p) for p in self.patient_ids}
 
-        self._source_dict = {}
-        self.len = 0
-        for patient_id in range(self._number_of_patients):
-            for record_id in self.record_ids_per_patient(patient_id):
-                for sample_id in self.sample_ids_per_record(patient_id, record_id):
-                    t = randint(0, 1000)
-                    dt = randint(1, 10)
-                    sig = Signal(
-                        start_time=timedelta(t),
-                        end_time=timedelta(t + dt),
-                        signal=randn(1, 200),
-                        signal_type=SignalType.FAKE,
-                        time_axis=np.expand_dims(linspace(t, t + dt, 200), axis=0),
-                    )
-                    samp = Sample(
-                        self.name,
-                        "fake version",
-                        patient_id=patient_id,
-                        record_id=record_id,
-                        sample_id=sample_id,
-                        signals={SignalType.FAKE: sig},
-                        data={k: torch.rand(7) for k in self.feature_types},
-                        metadata=None,
-                        label={k: torch.rand(7) for k in self.labels},
-                    )
-                    self._source_dict[(patient_id, record_id, sample_id)] = samp
-                    self.len += 1
+        # The samples are stored column-wise, a block per field with a row per sample,
+        # and Sample objects are only created on first access, as views of the blocks.
+        # The samples are shared between accesses, so the blocks are read-only and the
+        # data and label of a sample are read-only mappings
+        sample_ids = (
+            (patient_id, record_id, sample_id)
+            for patient_id in range(self._number_of_patients)
+            for record_id in self._record_ids[patient_id]
+            for sample_id in self.sample_ids_per_record(patient_id, record_id)
+        )
+        self._sample_rows = {idx: row for row, idx in enumerate(sample_ids)}
+        self.len = len(self._sample_rows)
+        self._samples: List[Optional[Sample]] = [None] * self.len
+
+        t = randint(0, 1000, self.len)
+        dt = randint(1, 10, self.len)
+        self._start_times = t.tolist()
+        self._end_times = (t + dt).tolist()
+        rng = default_rng()
+        # Generated directly in single precision, the dtype models train in
+        self._signals = rng.standard_normal((self.len, 1, 200), dtype=np.float32)
+        self._time_axes = linspace(t, t + dt, 200, axis=-1)
+        self._data = {k: _read_only_block(rng, self.len) for k in self.feature_types}
+        self._label = {k: _read_only_block(rng, self.len) for k in self.labels}
 
     def __getitem__(self, idx: Union[int, Sequence[int]]) -> Sample:
-        return self._source_dict[idx]
+        row = self._sample_rows[idx]
+        sample = self._samples[row]
+        if sample is None:
+            sample = self._samples[row] = self._create_sample(idx, row)
+        return sample
+
+    def _create_sample(self, idx: Tuple[int, int, int], row: int) -> Sample:
+        patient_id, record_id, sample_id = idx
+        sig = Signal(
+            start_time=timedelta(self._start_times[row]),
+            end_time=timedelta(self._end_times[row]),
+            signal=self._signals[row],
+            signal_type=SignalType.FAKE,
+            time_axis=self._time_axes[row : row + 1],
+        )
+        return Sample(
+            self.name,
+            "fake version",
+            patient_id=patient_id,
+            record_id=record_id,
+            sample_id=sample_id,
+            signals={SignalType.FAKE: sig},
+            data=MappingProxyType({k: v[row] for k, v in self._data.items()}),
+            metadata=None,
+            label=MappingProxyType({k: v[row] for k, v in self._label.items()}),
+        )
 
     def record_ids_per_patient(self, patient_id: int) -> Sequence[int]:
-        return tuple(list(range(self._num_records_per_patient[patient_id])))
+        return tuple(range(self._num_records_per_patient[patient_id]))
 
     def sample_ids_per_record(self, patient_id: int, record_id: int) -> Sequence[int]:
-        return tuple(list(range(self._num_samples_per_record[patient_id][record_id])))
+        return tuple(range(self._num_samples_per_record[patient_id][record_id]))
 
     def __len__(self):
         return self.len
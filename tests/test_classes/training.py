@@ -0,0 +1,81 @@
+from typing import Dict, Sequence
+
+import numpy as np
+import torch
+from torch import Tensor
+
+from physlearn.apis.loss import LossResult
+from physlearn.apis.training.metrics import BatchMetric, EpochMetric
+from physlearn.apis.training.results import BatchResult
+from physlearn.names import BatchMetricType, EpochMetricType, LabelType, LossType
+
+
+class FakeLossResult(LossResult):
+    __slots__ = ()
+
+    @property
+    def type(self) -> LossType:
+        return LossType.RAW
+
+
+class FakeAccuracy(BatchMetric):
+    """Fraction of equal labels, calculated as a tensor"""
+
+    def _calculate_metric(
+        self, y: Dict[LabelType, Tensor], y_pred: Dict[LabelType, Tensor]
+    ) -> float:
+        return float(self._calculate_metric_tensor(y, y_pred))
+
+    def _calculate_metric_tensor(
+        self, y: Dict[LabelType, Tensor], y_pred: Dict[LabelType, Tensor]
+    ) -> Tensor:
+        return (y[LabelType.FAKE] == y_pred[LabelType.FAKE]).double().mean()
+
+    @property
+    def type(self) -> BatchMetricType:
+        return BatchMetricType.ACCURACY
+
+
+class FakeNumCorrect(BatchMetric):
+    """Number of equal labels, calculated as a float"""
+
+    def _calculate_metric(
+        self, y: Dict[LabelType, Tensor], y_pred: Dict[LabelType, Tensor]
+    ) -> float:
+        return float((y[LabelType.FAKE] == y_pred[LabelType.FAKE]).sum().item())
+
+    @property
+    def type(self) -> BatchMetricType:
+        return BatchMetricType.NUM_CORRECT
+
+
+class FakeEpochAccuracy(EpochMetric):
+    """Mean of the batch accuracies"""
+
+    def _calculate_metric(self, batch_results: Sequence[BatchResult]) -> float:
+        return sum(b[BatchMetricType.ACCURACY] for b in batch_results) / len(
+            batch_results
+        )
+
+    @property
+    def type(self) -> EpochMetricType:
+        return EpochMetricType.ACCURACY
+
+    @property
+    def required_batch_metrics(self) -> Sequence[BatchMetricType]:
+        return (BatchMetricType.ACCURACY,)
+
+
+def fake_batch(size: int = 8):
+    y = {LabelType.FAKE: torch.randint(0, 2, (size,))}
+    y_pred = {LabelType.FAKE: torch.randint(0, 2, (size,))}
+    return y, y_pred
+
+
+class FakeVectorizedEpochAccuracy(FakeEpochAccuracy):
+    """Mean of the batch accuracies, calculated over the batch metric arrays"""
+
+    def _calculate_metric_vectorized(
+        self, batch_metrics: Dict[BatchMetricType, np.ndarray], batch_sizes: np.ndarray
+    ) -> float:
+        return float(batch_metrics[BatchMetricType.ACCURACY].mean())
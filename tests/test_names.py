@@ -0,0 +1,48 @@
+import sys
+
+import pytest
+
+from physlearn.names import (
+    BatchMetricType,
+    EpochMetricType,
+    NonSignalDataType,
+    SignalType,
+)
+
+
+def test_hash_by_identity():
+    d = {BatchMetricType.ACCURACY: 1, EpochMetricType.ACCURACY: 2}
+    assert d[BatchMetricType.ACCURACY] == 1
+    assert d[EpochMetricType.ACCURACY] == 2
+    assert SignalType("ecg") in {SignalType.ECG}
+
+
+def test_data_type_ordering():
+    assert SignalType.ECG < SignalType.EEG
+    assert SignalType.ECG <= SignalType.ECG
+    assert not SignalType.ECG < SignalType.ECG
+    assert sorted([SignalType.HR, SignalType.ECG]) == [SignalType.ECG, SignalType.HR]
+    assert SignalType.EEG > SignalType.ECG
+    assert SignalType.EEG >= SignalType.EEG
+
+
+def test_data_type_ordering_across_types():
+    mixed = [SignalType.HR, NonSignalDataType.AGE, SignalType.ECG]
+    assert sorted(mixed) == sorted(mixed, key=lambda t: t.value)
+
+
+def test_from_value():
+    assert SignalType.from_value("ecg") is SignalType.ECG
+    assert NonSignalDataType.from_value("age") is NonSignalDataType.AGE
+    with pytest.raises(ValueError, match=r"not a valid SignalType"):
+        SignalType.from_value("age")
+    with pytest.raises(ValueError):
+        SignalType.from_value(["ecg"])
+
+
+def test_interned_values():
+    value = "".join(["fake ", "signal"])
+    assert SignalType.FAKE.value is sys.intern(value)
+    assert BatchMetricType.NUM_CORRECT.value is sys.intern(
+        BatchMetricType.NUM_CORRECT.value
+    )
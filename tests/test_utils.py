@@ -0,0 +1,171 @@
+import hashlib
+import io
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+
+import numpy as np
+
+from physlearn import utils
+from physlearn.utils import (
+    SIGNATURE_FILE_SUFFIX,
+    _file_digest,
+    cached_sign,
+    create_time_axis,
+    find_digits_in_str,
+    find_files_with_extension,
+    find_letters_in_str,
+    mmap_signal,
+    safe_pickle,
+    sign_files,
+)
+
+
+def test_mmap_signal(tmp_path):
+    signal = np.arange(24, dtype=np.float32).reshape(2, 12)
+    path = tmp_path / "signal.bin"
+    path.write_bytes(b"header" + signal.tobytes())
+
+    mapped = mmap_signal(path, offset=6, shape=(2, 12), dtype=np.float32)
+    assert np.array_equal(mapped, signal)
+    with pytest.raises(ValueError, match=r"read-only"):
+        mapped[0, 0] = 17
+
+
+def test_cached_sign(tmp_path):
+    path = tmp_path / "record.edf"
+    path.write_bytes(b"physiological data" * 1000)
+    sign_file = path.with_suffix(SIGNATURE_FILE_SUFFIX)
+    expected = hashlib.blake2b(path.read_bytes()).hexdigest()
+
+    assert cached_sign(path) == expected
+    assert sign_file.read_text().endswith(expected)
+    with path.open("rb") as f:
+        assert _file_digest(f) == expected
+
+    # Unchanged files are signed from memory, without reading the cache file
+    sign_file.unlink()
+    assert cached_sign(path) == expected
+    assert not sign_file.exists()
+
+    # A cache of a different format or algorithm is recalculated
+    utils._cached_sign.cache_clear()
+    last_modified = str(path.stat().st_mtime_ns)
+    sign_file.write_text(last_modified + ":" + "0" * 32)
+    assert cached_sign(path) == expected
+    assert sign_file.read_text().endswith(expected)
+
+
+def test_file_digest_fallback(tmp_path):
+    data = bytes(range(256)) * 5000
+    assert _file_digest(io.BytesIO(data)) == hashlib.blake2b(data).hexdigest()
+
+    path = tmp_path / "empty.edf"
+    path.touch()
+    with path.open("rb") as f:
+        assert _file_digest(f) == hashlib.blake2b(b"").hexdigest()
+
+
+def test_create_time_axis():
+    start, dt = datetime(2021, 3, 1, 12), timedelta(milliseconds=4)
+    time_axis = create_time_axis(start, 1000, dt)
+    assert time_axis.dtype == np.dtype("datetime64[us]")
+    assert len(time_axis) == 1000
+    assert time_axis[0].astype(datetime) == start
+    assert time_axis[-1].astype(datetime) == start + 999 * dt
+    assert np.all(np.diff(time_axis) == np.timedelta64(dt))
+
+
+@pytest.mark.parametrize("string", ["patient_0042-rec17.edf", "", "סיגנל_3²", "ÉEG 12"])
+def test_find_digits_and_letters(string):
+    assert find_digits_in_str(string) == "".join(c for c in string if c.isdigit())
+    assert find_letters_in_str(string) == "".join(c for c in string if c.isalpha())
+
+
+def test_find_files_with_extension(tmp_path):
+    for name in ["a.edf", "b.txt", "sub/c.edf", "sub/deeper/d.edf", "sub/e.edf.bak"]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    (tmp_path / "link").symlink_to(tmp_path / "sub", target_is_directory=True)
+
+    found = find_files_with_extension("edf", tmp_path)
+    assert sorted(found) == sorted(tmp_path.glob("**/*.edf"))
+    assert len(found) == 3
+
+
+def test_find_files_with_extension_missing_root(tmp_path):
+    assert find_files_with_extension("edf", tmp_path / "missing") == []
+    path = tmp_path / "a.edf"
+    path.touch()
+    assert find_files_with_extension("edf", path) == list(path.glob("**/*.edf"))
+
+
+def test_quick_sign(tmp_path):
+    path = tmp_path / "record.h5"
+    data = bytearray(3 << 20)
+    path.write_bytes(data)
+    quick = cached_sign(path, quick=True)
+    assert quick != cached_sign(path)
+
+    # Changes in the middle of the file aren't part of the quick signature, changes in
+    # the head, tail and size are
+    data[len(data) // 2] = 1
+    path.write_bytes(data)
+    assert cached_sign(path, quick=True) == quick
+    data[-1] = 1
+    path.write_bytes(data)
+    assert cached_sign(path, quick=True) != quick
+    path.write_bytes(data + b"\0")
+    assert cached_sign(path, quick=True) != quick
+
+
+def test_safe_pickle(tmp_path):
+    obj = {"signal": np.arange(1000, dtype=np.float32), "name": "fake"}
+    safe_pickle(str(tmp_path) + "/", "record", obj)
+    (path,) = tmp_path.glob("record*.pkl")
+    with path.open("rb") as f:
+        loaded = pickle.load(f)
+    assert loaded["name"] == "fake"
+    np.testing.assert_array_equal(loaded["signal"], obj["signal"])
+
+
+def test_safe_pickle_unique_names(tmp_path, monkeypatch):
+    for _ in range(10):
+        safe_pickle(str(tmp_path) + "/", "record", 17)
+    assert len(list(tmp_path.glob("record*.pkl"))) == 10
+
+    monkeypatch.setattr(utils, "time_ns", lambda: 17)
+    monkeypatch.setattr(utils, "token_hex", lambda n: "same")
+    safe_pickle(str(tmp_path) + "/", "collision", 17)
+    with pytest.raises(RuntimeError, match=r"unique name"):
+        safe_pickle(str(tmp_path) + "/", "collision", 18)
+
+
+def test_sign_files(tmp_path):
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"record_{i}.edf"
+        path.write_bytes(bytes([i]) * 10000)
+        paths.append(path)
+    assert sign_files(paths, max_workers=4) == [cached_sign(p) for p in paths]
+    assert len(set(sign_files(paths, quick=True))) == len(paths)
+
+
+def test_sign_files_duplicates(tmp_path, monkeypatch):
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"record_{i}.edf"
+        path.write_bytes(bytes([i]) * 10000)
+        paths.append(path)
+    signed = []
+
+    def sign(path, quick=False):
+        signed.append(path)
+        return cached_sign(path, quick)
+
+    monkeypatch.setattr(utils, "cached_sign", sign)
+    duplicated = [paths[0], paths[1], paths[0], paths[0]]
+    assert sign_files(duplicated, max_workers=4) == [cached_sign(p) for p in duplicated]
+    assert sorted(signed) == paths